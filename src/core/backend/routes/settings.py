@@ -950,7 +950,7 @@ async def cleanup_gpt_sovits_install():
         return {"status": "ok", "message": "삭제할 폴더가 없습니다"}
 
     try:
-        installer.cleanup()
+        await installer.cleanup()
         reset_installer()
         return {"status": "ok", "message": "설치 폴더가 삭제되었습니다"}
     except Exception as e:
@@ -43,7 +43,7 @@ class GPTSoVITSModelAdapter(ModelAdapter):
     def list_models(self) -> list[ModelInfo]:
         """모든 모델 목록"""
         models = []
-        for legacy_model in self._manager.list_all_models():
+        for legacy_model in self._manager.iter_all_models():
             model_type = self.get_model_type(legacy_model.char_id)
 
             # trained_at 파싱
@@ -4,7 +4,13 @@
 """
 
 from .text_processor import preprocess_text_for_tts, split_text_for_tts, normalize_numbers_for_tts
-from .audio_utils import add_silence_padding, concatenate_wav, get_audio_duration
+from .audio_utils import (
+    add_silence_padding,
+    concatenate_wav,
+    get_audio_duration,
+    list_audio_files,
+    parse_wav_duration,
+)
 from .reference_manager import (
     ReferenceManager,
     ReferenceAudio,
@@ -32,6 +38,8 @@ __all__ = [
     "add_silence_padding",
     "concatenate_wav",
     "get_audio_duration",
+    "list_audio_files",
+    "parse_wav_duration",
     # reference_manager
     "ReferenceManager",
     "ReferenceAudio",
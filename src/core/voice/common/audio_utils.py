@@ -5,10 +5,18 @@
 
 import io
 import logging
+import os
+import struct
 import subprocess
 import wave
 from pathlib import Path
 
+# 오디오 헤더만 읽어 길이 계산 (MP3/OGG 포함): 없으면 ffprobe/mutagen 사용
+try:
+    import soundfile as _sf
+except (ImportError, OSError):  # libsndfile 로드 실패 시 OSError
+    _sf = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,14 +99,75 @@ def concatenate_wav(audio_chunks: list[bytes]) -> bytes | None:
         return None
 
 
+_WAV_CHUNK = struct.Struct("<4sI")
+_WAV_FMT = struct.Struct("<HHII")  # format, channels, sample_rate, byte_rate
+
+
+def parse_wav_duration(header: bytes, total_size: int) -> float | None:
+    """WAV 헤더 바이트에서 길이(초) 계산 (해석 불가 시 None)
+
+    fmt/data 청크를 순서대로 찾아 data 크기 / byte_rate로 계산합니다.
+    스트리밍 응답처럼 data 크기가 기록되지 않은 경우 전체 크기를 사용합니다.
+
+    Args:
+        header: WAV 앞부분 바이트 (fmt/data 청크 헤더 포함, 보통 128바이트)
+        total_size: WAV 전체 크기 (바이트)
+
+    Returns:
+        오디오 길이 (초), 헤더 해석 불가 시 None
+    """
+    if len(header) < 12 or header[0:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+    byte_rate = 0
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id, chunk_size = _WAV_CHUNK.unpack_from(header, offset)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            if body + _WAV_FMT.size > len(header):
+                return None
+            _, _, _, byte_rate = _WAV_FMT.unpack_from(header, body)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            if chunk_size == 0 or chunk_size == 0xFFFFFFFF or body + chunk_size > total_size:
+                chunk_size = total_size - body
+            return chunk_size / byte_rate
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def list_audio_files(directory: Path, extensions: tuple[str, ...] = ("mp3", "wav")) -> list[Path]:
+    """디렉토리의 오디오 파일 목록 (scandir 한 번, 확장자 대소문자 무시, 이름순)
+
+    Args:
+        directory: 오디오 디렉토리
+        extensions: 포함할 확장자 (점 제외, 소문자)
+
+    Returns:
+        오디오 파일 경로 목록, 디렉토리가 없으면 빈 목록
+    """
+    try:
+        with os.scandir(directory) as it:
+            paths = [
+                entry.path for entry in it
+                if os.path.splitext(entry.name)[1][1:].lower() in extensions
+                and entry.is_file()
+            ]
+    except OSError:
+        return []
+    paths.sort()
+    return [Path(path) for path in paths]
+
+
 def get_audio_duration(audio_path: Path) -> float:
     """오디오 파일 길이 계산 (초)
 
     여러 방법으로 오디오 길이를 측정합니다:
     1. WAV 파일: wave 모듈로 직접 읽기
-    2. ffprobe: 모든 포맷 지원
-    3. mutagen: 설치된 경우
-    4. 폴백: 파일 크기 기반 추정
+    2. soundfile: 헤더만 읽기 (MP3/OGG 포함, 프로세스 실행 없음)
+    3. ffprobe: 모든 포맷 지원
+    4. mutagen: 설치된 경우
 
     Args:
         audio_path: 오디오 파일 경로
@@ -116,6 +185,13 @@ def get_audio_duration(audio_path: Path) -> float:
         except Exception:
             pass
 
+    # soundfile (libsndfile) 헤더 정보
+    if _sf is not None:
+        try:
+            return _sf.info(str(audio_path)).duration
+        except Exception:
+            pass
+
     # ffprobe로 정확한 길이 측정 (MP3, WAV 등 모든 포맷)
     try:
         result = subprocess.run(
@@ -148,10 +224,5 @@ def get_audio_duration(audio_path: Path) -> float:
     except Exception:
         pass
 
-    # 최후의 폴백: MP3 비트레이트 추정 (128kbps 가정)
-    try:
-        size = audio_path.stat().st_size
-        # 128kbps = 16000 bytes/sec
-        return size / 16000
-    except Exception:
-        return 0.0
+    # 길이를 알 수 없음 (크기 기반 추정은 점수 계산을 왜곡하므로 사용하지 않음)
+    return 0.0
@@ -4,16 +4,35 @@
 training_worker.py와 finetuning_worker.py에서 공통으로 사용합니다.
 """
 
-import json
+import functools
 import logging
 import re
 from pathlib import Path
 
 from ...common.language_codes import SHORT_LANG_MAP
 
+# charword_table.json(수 MB) 파싱: orjson이 있으면 사용
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=2)
+def _load_char_words(path: str, mtime_ns: int) -> dict:
+    """charword_table.json의 charWords 로드 (같은 파일/수정 시각이면 재사용)"""
+    with open(path, "rb") as f:
+        return _json_loads(f.read()).get("charWords", {})
+
+
+@functools.lru_cache(maxsize=32)
+def _skin_pattern(char_id: str) -> re.Pattern:
+    """스킨 voiceAsset 패턴 (char_id_{skin}#{num}/{voice_id})"""
+    return re.compile(rf'^{re.escape(char_id)}_([a-z]+)#(\d+)/(.+)$')
+
+
 def _extract_voice_id_from_asset(voice_asset: str, char_id: str) -> str | None:
     """voiceAsset에서 스킨 접미사 포함 voice_id 추출
 
@@ -29,8 +48,7 @@ def _extract_voice_id_from_asset(voice_asset: str, char_id: str) -> str | None:
         return voice_asset[len(char_id) + 1:]  # CN_001
 
     # 스킨 캐릭터: char_003_kalts_boc#6/CN_001
-    skin_pattern = re.compile(rf'^{re.escape(char_id)}_([a-z]+)#(\d+)/(.+)$')
-    match = skin_pattern.match(voice_asset)
+    match = _skin_pattern(char_id).match(voice_asset)
     if match:
         skin_type = match.group(1)  # boc, epoque, iteration
         skin_num = match.group(2)   # 6, 34, 2
@@ -85,15 +103,17 @@ def load_charword_transcripts(
         return {}
 
     try:
-        with open(charword_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        char_words = _load_char_words(str(charword_path), charword_path.stat().st_mtime_ns)
 
         result = {}
         skin_count = 0
 
-        for key, item in data.get("charWords", {}).items():
-            # voiceAsset에서 스킨 접미사 포함 voice_id 추출
+        for item in char_words.values():
+            # 다른 캐릭터 대사는 접두사 비교로 바로 제외 (기본/스킨 모두 char_id로 시작)
             voice_asset = item.get("voiceAsset", "")
+            if not voice_asset.startswith(char_id):
+                continue
+            # voiceAsset에서 스킨 접미사 포함 voice_id 추출
             voice_id = _extract_voice_id_from_asset(voice_asset, char_id)
 
             if voice_id is None:
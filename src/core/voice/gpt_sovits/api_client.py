@@ -8,6 +8,7 @@ import logging
 import os
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 from pathlib import Path
@@ -19,7 +20,7 @@ from .config import GPTSoVITSConfig
 
 # 공통 모듈에서 import
 from ..common.text_processor import preprocess_text_for_tts, split_text_for_tts
-from ..common.audio_utils import add_silence_padding, concatenate_wav
+from ..common.audio_utils import add_silence_padding, concatenate_wav, parse_wav_duration
 from ..common.reference_manager import (
     select_reference_by_score,
     select_reference_hybrid,
@@ -34,6 +35,11 @@ _GPT_SOVITS_LOG = LOG_DIR / "gpt_sovits.log"
 _GPT_SOVITS_BACKUP_COUNT = 2  # 최대 3개 파일 보존
 
 
+# API 서버별(api_url) 설정된 학습 모델 (sovits 경로, gpt 경로, 각 mtime_ns)
+# 같은 서버를 쓰는 클라이언트 인스턴스가 여러 개일 수 있으므로 모듈 수준에서 공유
+_loaded_weights: dict[str, tuple[str, str, int, int]] = {}
+
+
 def _rotate_log_file(log_path: Path, backup_count: int = 2) -> None:
     """로그 파일 수동 로테이션 (프로세스 시작 시 호출)"""
     if not log_path.exists():
@@ -55,20 +61,33 @@ class GPTSoVITSAPIClient:
     GPT-SoVITS API 서버를 관리하고 음성 합성을 수행합니다.
     """
 
+    # 서버 응답 확인 결과 재사용 시간 (초)
+    API_ALIVE_TTL = 5.0
+
     def __init__(self, config: Optional[GPTSoVITSConfig] = None):
         self.config = config or GPTSoVITSConfig()
         self._api_process: Optional[subprocess.Popen] = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._log_thread: Optional[threading.Thread] = None
+        self._last_alive_at = 0.0  # 마지막으로 서버 응답을 확인한 시각 (monotonic)
 
     @property
     def api_url(self) -> str:
         return self.config.api_url
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """HTTP 세션 가져오기"""
+        """HTTP 세션 가져오기
+
+        상태 확인, 모델 로드, 합성 요청이 하나의 keep-alive 연결 풀을 공유합니다.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            concurrency = max(1, self.config.batch_concurrency)
+            connector = aiohttp.TCPConnector(
+                limit=max(8, concurrency * 2),
+                force_close=False,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
         return self._session
 
     async def close(self):
@@ -77,12 +96,28 @@ class GPTSoVITSAPIClient:
             await self._session.close()
         self.stop_api_server()
 
-    async def is_api_running(self) -> bool:
+    def _mark_api_down(self):
+        """서버 응답 실패/종료 시 캐시된 서버 상태 무효화 (재시작 시 가중치도 초기화됨)"""
+        self._last_alive_at = 0.0
+        self._forget_loaded_weights()
+
+    def _forget_loaded_weights(self):
+        """이 서버에 설정된 학습 모델 기록 삭제 (다음 set_model에서 반드시 재설정)"""
+        _loaded_weights.pop(self.api_url, None)
+
+    async def is_api_running(self, log_failure: bool = True) -> bool:
         """API 서버 실행 중인지 확인
 
         GPT-SoVITS API는 루트 엔드포인트가 없을 수 있으므로,
         연결 가능 여부로 판단합니다.
+
+        Args:
+            log_failure: 연결 실패 로그 출력 여부 (준비 대기 폴링 시 False)
         """
+        # 최근 API_ALIVE_TTL초 안에 응답을 확인했으면 재확인 생략
+        if time.monotonic() - self._last_alive_at < self.API_ALIVE_TTL:
+            return True
+
         try:
             session = await self._get_session()
             # GPT-SoVITS v2는 /tts 엔드포인트가 GET으로 접근 시 405를 반환하지만
@@ -92,9 +127,13 @@ class GPTSoVITSAPIClient:
                 timeout=aiohttp.ClientTimeout(total=10),  # 합성 중에도 여유 있게
             ) as resp:
                 # 200, 404, 405 등 어떤 응답이든 서버가 살아있음
+                self._last_alive_at = time.monotonic()
                 return True
         except aiohttp.ClientConnectorError as e:
             # 연결 불가 = 서버 미실행
+            self._mark_api_down()
+            if not log_failure:
+                return False
             logger.warning(f"[API 상태] 연결 불가: {e}")
             # 프로세스가 예기치 않게 종료된 경우 원인 파악
             if self._api_process and self._api_process.poll() is not None:
@@ -210,6 +249,7 @@ class GPTSoVITSAPIClient:
                     f"  is_half={env['is_half']}, "
                     f"CUDA_ALLOC_CONF={env.get('PYTORCH_CUDA_ALLOC_CONF', 'default')}"
                 )
+                self._forget_loaded_weights()
                 self._api_process = subprocess.Popen(
                     ["powershell", "-NoProfile", "-Command", ps_command],
                     cwd=str(cwd_abs),
@@ -218,6 +258,7 @@ class GPTSoVITSAPIClient:
                 )
             else:
                 # Linux/Mac: PIPE + 데몬 스레드로 로그 파일 기록
+                self._forget_loaded_weights()
                 self._api_process = subprocess.Popen(
                     cmd,
                     cwd=str(cwd_abs),
@@ -409,6 +450,7 @@ class GPTSoVITSAPIClient:
                 self._api_process.kill()
             logger.info("GPT-SoVITS API 서버 종료")
         self._api_process = None
+        self._mark_api_down()
 
     async def wait_for_api_ready(self, timeout: float = 60.0) -> bool:
         """API 서버가 준비될 때까지 대기
@@ -419,13 +461,22 @@ class GPTSoVITSAPIClient:
         Returns:
             bool: API 준비 완료 여부
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # 짧은 간격으로 시작해 점차 늘림 (준비 직후 바로 감지, 최대 0.25초 간격)
+        delay = 0.05
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if await self.is_api_running():
+        while loop.time() < deadline:
+            if await self.is_api_running(log_failure=False):
                 logger.info("GPT-SoVITS API 서버 준비 완료")
                 return True
-            await asyncio.sleep(1.0)
+            # 서버 프로세스가 이미 종료되었으면 더 기다리지 않음
+            if self._api_process and self._api_process.poll() is not None:
+                crash_hint = self._detect_crash_cause()
+                logger.error(f"API 서버 프로세스 종료됨: {crash_hint}")
+                return False
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+            delay = min(delay * 1.3, 0.25)
 
         logger.error(f"API 서버 준비 시간 초과 ({timeout}초)")
         return False
@@ -443,10 +494,25 @@ class GPTSoVITSAPIClient:
         sovits_path = self.config.get_sovits_model_path(char_id, lang)
         gpt_path = self.config.get_gpt_model_path(char_id, lang)
 
-        if not sovits_path.exists() or not gpt_path.exists():
+        try:
+            weights = (
+                str(sovits_path),
+                str(gpt_path),
+                sovits_path.stat().st_mtime_ns,
+                gpt_path.stat().st_mtime_ns,
+            )
+        except OSError:
             logger.error(f"모델 파일이 없습니다: {char_id}")
             return False
 
+        # 서버에 이미 같은 가중치가 설정되어 있으면 재로드 생략
+        if _loaded_weights.get(self.api_url) == weights:
+            logger.info(f"모델이 이미 서버에 로드됨: {char_id}")
+            return True
+
+        # 설정 도중에는 서버 가중치가 섞여 있을 수 있으므로 기록부터 삭제
+        self._forget_loaded_weights()
+
         try:
             session = await self._get_session()
 
@@ -468,10 +534,13 @@ class GPTSoVITSAPIClient:
                     logger.error(f"GPT 모델 로드 실패: {await resp.text()}")
                     return False
 
+            self._last_alive_at = time.monotonic()
+            _loaded_weights[self.api_url] = weights
             logger.info(f"모델 로드 완료: {char_id}")
             return True
 
         except Exception as e:
+            self._mark_api_down()
             logger.error(f"모델 로드 중 오류: {e}")
             return False
 
@@ -720,40 +789,41 @@ class GPTSoVITSAPIClient:
 
         start_time = time.time()
 
-        connector = aiohttp.TCPConnector(force_close=True)
-        timeout = aiohttp.ClientTimeout(total=90)
-
         try:
-            async with aiohttp.ClientSession(
-                connector=connector, timeout=timeout
-            ) as session:
-                async with session.post(
-                    f"{self.api_url}/tts",
-                    json=params,
-                ) as resp:
-                    elapsed = time.time() - start_time
+            session = await self._get_session()
+            async with session.post(
+                f"{self.api_url}/tts",
+                json=params,
+                timeout=aiohttp.ClientTimeout(total=90),
+            ) as resp:
+                elapsed = time.time() - start_time
 
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        logger.error(f"[합성] 실패 ({elapsed:.1f}초): {error_text}")
-                        return None
+                if resp.status != 200:
+                    if resp.status >= 500:
+                        self._mark_api_down()
+                    error_text = await resp.text()
+                    logger.error(f"[합성] 실패 ({elapsed:.1f}초): {error_text}")
+                    return None
 
-                    audio_data = await resp.read()
+                audio_data = await resp.read()
+                self._last_alive_at = time.monotonic()
 
-                    # 스피커 절전 모드로 인한 앞부분 잘림 방지
-                    audio_data = add_silence_padding(audio_data, silence_ms=150)
+            # 스피커 절전 모드로 인한 앞부분 잘림 방지
+            audio_data = add_silence_padding(audio_data, silence_ms=150)
 
-                    logger.debug(
-                        f"[합성] 세그먼트 완료 ({elapsed:.1f}초, {len(audio_data):,} bytes)"
-                    )
+            logger.debug(
+                f"[합성] 세그먼트 완료 ({elapsed:.1f}초, {len(audio_data):,} bytes)"
+            )
 
-                    await asyncio.sleep(0.3)
-                    return audio_data
+            await asyncio.sleep(0.3)
+            return audio_data
 
         except asyncio.TimeoutError:
+            self._mark_api_down()
             logger.error("[합성] 시간 초과 (90초)")
             return None
         except aiohttp.ClientError as e:
+            self._mark_api_down()
             logger.error(f"[합성] HTTP 오류: {type(e).__name__}: {e}")
             # API 프로세스가 죽었는지 확인
             if self._api_process and self._api_process.poll() is not None:
@@ -775,7 +845,8 @@ class GPTSoVITSAPIClient:
         top_p: float = 1.0,
         temperature: float = 0.9,  # 약간만 높임 (0.8→0.9)
         nickname: str | None = None,
-    ) -> bool:
+        make_parent_dir: bool = True,
+    ) -> Optional[float]:
         """텍스트를 음성으로 합성하여 파일로 저장
 
         Args:
@@ -787,9 +858,10 @@ class GPTSoVITSAPIClient:
             top_k: 샘플링 다양성 (1~20)
             top_p: Nucleus sampling (0.1~1.0)
             temperature: 음성 랜덤성 (0.1~2.0)
+            make_parent_dir: 출력 디렉토리 생성 여부 (호출자가 이미 만든 경우 False)
 
         Returns:
-            bool: 성공 여부
+            오디오 길이 (초, 헤더 해석 실패 시 0.0) 또는 실패 시 None
         """
         audio_data = await self.synthesize(
             text,
@@ -802,8 +874,28 @@ class GPTSoVITSAPIClient:
             nickname=nickname,
         )
         if audio_data is None:
-            return False
+            return None
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(audio_data)
-        return True
+        if make_parent_dir:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # 메모리의 WAV를 그대로 기록하고, 길이는 같은 버퍼의 헤더에서 계산
+        # (패딩/세그먼트 연결 후처리 때문에 응답을 디스크로 직접 스트리밍하지 않음)
+        # 임시 파일에 다 쓴 뒤 이름을 바꿔, 중단된 합성의 잘린 파일이 결과로 재사용되지 않게 함
+        fd, tmp_name = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f".{output_path.stem}-", suffix=".tmp"
+        )
+        try:
+            try:
+                view = memoryview(audio_data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return parse_wav_duration(audio_data[:128], len(audio_data)) or 0.0
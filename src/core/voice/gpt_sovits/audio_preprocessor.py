@@ -15,6 +15,8 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Callable
 
+from ..common.audio_utils import list_audio_files
+
 logger = logging.getLogger(__name__)
 
 
@@ -894,7 +896,7 @@ class AudioPreprocessor:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        audio_files = list(audio_dir.glob("*.mp3")) + list(audio_dir.glob("*.wav"))
+        audio_files = list_audio_files(audio_dir)
         total = len(audio_files)
 
         if total == 0:
@@ -976,7 +978,7 @@ class AudioPreprocessor:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # 오디오 파일 수집
-        audio_files = list(audio_dir.glob("*.mp3")) + list(audio_dir.glob("*.wav"))
+        audio_files = list_audio_files(audio_dir)
         total = len(audio_files)
 
         if total == 0:
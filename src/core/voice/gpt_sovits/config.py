@@ -132,6 +132,7 @@ class GPTSoVITSConfig:
     top_k: int = 12  # 샘플링 다양성 (5~15 권장)
     top_p: float = 1.0  # Nucleus sampling (0.1~1.0)
     temperature: float = 0.8  # 음성 랜덤성 (0.6~1.0, 낮을수록 안정)
+    batch_concurrency: int = 2  # 일괄 합성 시 동시 요청 수 (API 서버 GPU 부하 고려)
 
     # 언어 설정 (한국어 우선)
     default_language: str = "ko"
@@ -137,6 +137,16 @@ def format_subprocess_error(script_name: str, error_text: str) -> str:
     return error_text
 
 
+def _emit(data: dict):
+    """메시지 한 줄을 UTF-8 바이트로 stdout에 기록 (트레이너가 줄 단위 바이트로 파싱)
+
+    콘솔 코드 페이지와 무관하게 UTF-8로 쓰고, 쓰기/flush를 한 번씩만 수행합니다.
+    """
+    sys.stdout.flush()  # print 등으로 텍스트 계층에 남은 출력을 먼저 내보냄
+    sys.stdout.buffer.write(json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def emit_progress(stage: str, progress: float, message: str = "",
                   current_epoch: int = 0, total_epochs: int = 0,
                   substage: str = ""):
@@ -150,7 +160,7 @@ def emit_progress(stage: str, progress: float, message: str = "",
         "total_epochs": total_epochs,
         "substage": substage,
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def emit_error(message: str, error: str = ""):
@@ -160,7 +170,7 @@ def emit_error(message: str, error: str = ""):
         "message": message,
         "error": error,
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def emit_complete(char_id: str, char_name: str, cleaned_size: int = 0):
@@ -171,7 +181,7 @@ def emit_complete(char_id: str, char_name: str, cleaned_size: int = 0):
         "char_name": char_name,
         "cleaned_size": cleaned_size,  # 정리된 용량 (bytes)
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def cleanup_training_data(output_dir: Path) -> int:
@@ -312,7 +322,9 @@ def slice_audio_files(audio_dir: Path, output_dir: Path,
     output_dir.mkdir(parents=True, exist_ok=True)
     sliced_files = []
 
-    audio_files = list(audio_dir.glob("*.mp3")) + list(audio_dir.glob("*.wav"))
+    from core.voice.common.audio_utils import list_audio_files
+
+    audio_files = list_audio_files(audio_dir)
     total = len(audio_files)
 
     for i, audio_path in enumerate(audio_files):
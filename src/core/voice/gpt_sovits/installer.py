@@ -5,12 +5,21 @@ GPT-SoVITS Windows 통합 패키지를 다운로드하여 설치합니다.
 """
 
 import asyncio
+import functools
+import hashlib
+import io
+import json
 import logging
+import mmap
+import os
+import re
 import shutil
-import subprocess
 import sys
-from pathlib import Path
-from typing import Awaitable, Callable, Optional, Union
+import tempfile
+import time
+from collections import deque
+from pathlib import Path, PureWindowsPath
+from typing import Awaitable, Callable, Optional, TextIO, Union
 from dataclasses import dataclass
 
 import aiohttp
@@ -18,6 +27,11 @@ import py7zr
 
 logger = logging.getLogger(__name__)
 
+# 7-Zip 배너에서 버전 추출 ("7-Zip 24.08", "7-Zip [64] 16.02" 등)
+_SEVEN_ZIP_VERSION_RE = re.compile(r"7-Zip(?:\s*\[\d+\]|\s*\(\w\))?\s+(\d+)\.(\d+)")
+# 7z -bsp1 진행률 표기 (" 37% 1234 - file")
+_SEVEN_ZIP_PERCENT_RE = re.compile(rb"(\d{1,3})%")
+
 
 @dataclass
 class InstallProgress:
@@ -28,10 +42,145 @@ class InstallProgress:
     error: Optional[str] = None
 
 
+# pip 출력 단계 판별 (Downloading/Installing/Successfully) 및 단계별 진행률
+_PIP_STAGE_RE = re.compile(rb"(downloading|installing|successfully)", re.IGNORECASE)
+_PIP_STAGE_PROGRESS_GPT = {b"downloading": 0.3, b"installing": 0.7, b"successfully": 0.85}
+_PIP_STAGE_PROGRESS_ARKSYNTH = {b"downloading": 0.4, b"installing": 0.7, b"successfully": 0.9}
+
+# GPT-SoVITS runtime에서 실행하는 torch 정보 조회 스크립트 (JSON 한 줄 출력)
+_TORCH_INFO_SCRIPT = """
+import json
+import torch
+info = {
+    "version": torch.__version__,
+    "cuda_version": getattr(torch.version, "cuda", None),
+    "cuda_available": False,
+    "arch_list": [],
+    "gpu_sm": None,
+}
+try:
+    info["arch_list"] = torch.cuda.get_arch_list()
+except Exception:
+    pass
+try:
+    info["cuda_available"] = torch.cuda.is_available()
+    if info["cuda_available"]:
+        props = torch.cuda.get_device_properties(0)
+        info["gpu_sm"] = props.major * 10 + props.minor
+except Exception:
+    pass
+print(json.dumps(info))
+"""
+
+
+async def _run(argv: list[str], timeout: float = 60) -> tuple[int, str, str]:
+    """서브프로세스 실행 (이벤트 루프를 막지 않음)
+
+    Returns:
+        (returncode, stdout, stderr)
+
+    Raises:
+        asyncio.TimeoutError: timeout 초과 시 (프로세스는 종료됨)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _local_gpu_sm() -> Optional[int]:
+    """ArkSynth 쪽 torch로 조회한 GPU compute capability (예: 86, 120)
+
+    GPU는 프로세스 수명 동안 바뀌지 않으므로 한 번만 조회합니다.
+    CUDA를 쓸 수 없으면 None.
+    """
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            return None
+        props = torch.cuda.get_device_properties(0)
+        return props.major * 10 + props.minor
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _max_supported_sm(arch_list: tuple[str, ...]) -> Optional[int]:
+    """PyTorch arch_list("sm_86", "sm_90a" 등)에서 지원하는 최대 sm 값"""
+    supported = []
+    for arch in arch_list:
+        if not arch.startswith("sm_"):
+            continue
+        try:
+            supported.append(int(arch[3:].rstrip("a")))
+        except ValueError:
+            continue
+    return max(supported) if supported else None
+
+
+def _archive_member_parts(name: str) -> tuple[str, ...]:
+    """압축 항목 이름을 경로 구성요소로 분리 (절대 경로/상위 참조는 거부)"""
+    normalized = name.replace("\\", "/")
+    if normalized.startswith("/") or PureWindowsPath(normalized).drive:
+        raise Exception(f"압축 항목 경로가 절대 경로입니다: {name}")
+    parts = tuple(part for part in normalized.split("/") if part and part != ".")
+    if ".." in parts:
+        raise Exception(f"압축 항목 경로가 설치 폴더를 벗어납니다: {name}")
+    return parts
+
+
 # 콜백 타입: 동기 또는 비동기 모두 지원
 ProgressCallback = Callable[[InstallProgress], Union[None, Awaitable[None]]]
 
 
+class _MmapReader(io.RawIOBase):
+    """mmap을 감싼 읽기 전용 파일 객체 (py7zr 입력용)
+
+    커널 페이지 캐시에서 직접 읽어 버퍼 I/O의 추가 복사를 피합니다.
+    """
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)
+        pos = self._mm.tell()
+        n = min(len(view), len(self._mm) - pos)
+        if n <= 0:
+            return 0
+        # mmap 슬라이스는 bytes 사본을 만들므로 memoryview로 직접 복사
+        with memoryview(self._mm) as src:
+            view[:n] = src[pos:pos + n]
+        self._mm.seek(pos + n)
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mm.seek(offset, whence)
+        return self._mm.tell()
+
+    def tell(self) -> int:
+        return self._mm.tell()
+
+
 class GPTSoVITSInstaller:
     """GPT-SoVITS 자동 설치 관리자
 
@@ -45,17 +194,35 @@ class GPTSoVITSInstaller:
 
     ARCHIVE_FILENAME = "gpt_sovits_package.7z"
 
-    # 패키지 변형별 설정 (URL, 최소 파일 크기, 압축 해제 후 폴더명)
+    # 다운로드 파일 쓰기 버퍼 크기 (8MB)
+    WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+    # Range 병렬 다운로드 구간 수
+    DOWNLOAD_SEGMENTS = 8
+    # 단일 스트림 다운로드 시 writer 태스크로 넘기는 대기 청크 수
+    WRITE_QUEUE_SIZE = 32
+    # 다운로드 진행률 콜백 최소 간격 (초)
+    DOWNLOAD_PROGRESS_INTERVAL = 0.2
+    # 중간 진행률 전달 간격 (초, 20Hz)
+    PROGRESS_PUMP_INTERVAL = 0.05
+    # runtime torch 정보 캐시 유지 시간 (초)
+    TORCH_INFO_TTL = 30.0
+    # is_installed 결과 캐시 유지 시간 (초)
+    IS_INSTALLED_TTL = 2.0
+
+    # 패키지 변형별 설정 (URL, 최소 파일 크기, 압축 해제 후 폴더명, SHA-256)
+    # sha256이 None이면 무결성 검증을 생략합니다.
     PACKAGE_VARIANTS: dict[str, dict] = {
         "standard": {
             "url": "https://huggingface.co/lj1995/GPT-SoVITS-windows-package/resolve/main/GPT-SoVITS-v2pro-20250604.7z",
             "folder": "GPT-SoVITS-v2pro-20250604",
             "min_size": 7_500_000_000,  # ~7.8GB
+            "sha256": None,
         },
         "nvidia50": {
             "url": "https://huggingface.co/lj1995/GPT-SoVITS-windows-package/resolve/main/GPT-SoVITS-v2pro-20250604-nvidia50.7z",
             "folder": "GPT-SoVITS-v2pro-20250604-nvidia50",
             "min_size": 8_500_000_000,  # ~8.8GB
+            "sha256": None,
         },
     }
     # 모든 알려진 폴더명 (설치 감지용)
@@ -63,38 +230,74 @@ class GPTSoVITSInstaller:
 
     def __init__(self, install_path: Optional[Path] = None):
         self.install_path = install_path or self.DEFAULT_INSTALL_PATH
-        self._cancelled = False
+        self._cancel_event = asyncio.Event()
         self._variant: str = "standard"  # 현재 설치에 사용할 패키지 변형
+        # 마지막으로 전달한 (stage, 0.5% 단위 진행률) — 중복 콜백 생략용
+        self._last_emit: tuple[Optional[str], int] = (None, -1)
+        self._last_download_emit = 0.0
+        # 전달 대기 중인 최신 진행률 (콜백, 값)과 이를 내보내는 태스크
+        self._progress_slot: Optional[tuple[ProgressCallback, InstallProgress]] = None
+        self._progress_pump: Optional[asyncio.Task] = None
+        # GPT-SoVITS runtime torch 정보 캐시 (_query_torch_info)
+        self._torch_info: Optional[dict] = None
+        self._torch_info_ts = 0.0
+        # 경로/설치 상태 캐시 (반복 stat 호출 방지)
+        self.log_file = self.install_path / "install.log"
+        self._log_fh: Optional[TextIO] = None  # 설치 중 열어두는 로그 핸들
+        self._session: Optional[aiohttp.ClientSession] = None  # _get_session
+        self._found_paths: Optional[tuple[Path, Path]] = None  # (gpt_sovits_path, python_exe)
+        self._is_installed_cache: Optional[tuple[float, bool]] = None  # (시각, 결과)
 
     @property
     def python_exe(self) -> Path:
         """Python 실행 파일 경로 (통합 패키지 runtime)"""
+        if self._found_paths is not None:
+            return self._found_paths[1]
         return self.gpt_sovits_path / "runtime" / "python.exe"
 
     @property
     def gpt_sovits_path(self) -> Path:
-        """GPT-SoVITS 경로 (실제 존재하는 폴더 자동 탐색)"""
+        """GPT-SoVITS 경로 (실제 존재하는 폴더 자동 탐색)
+
+        존재하는 폴더를 찾으면 이후에는 탐색 없이 재사용합니다.
+        """
+        if self._found_paths is not None:
+            return self._found_paths[0]
         # 1) 이미 설치된 폴더가 있으면 그것을 사용
         for folder in self.KNOWN_FOLDERS:
             candidate = self.install_path / folder
             if candidate.exists():
+                self._found_paths = (candidate, candidate / "runtime" / "python.exe")
                 return candidate
         # 2) 없으면 현재 variant 설정 기반
         variant_info = self.PACKAGE_VARIANTS.get(self._variant, {})
         folder = variant_info.get("folder", self.KNOWN_FOLDERS[0])
         return self.install_path / folder
 
-    @property
-    def log_file(self) -> Path:
-        """설치 로그 파일"""
-        return self.install_path / "install.log"
+    def _invalidate_path_cache(self):
+        """경로/설치 상태 캐시 초기화 (설치·삭제 후 호출)"""
+        self._found_paths = None
+        self._is_installed_cache = None
 
     def is_installed(self) -> bool:
-        """설치 완료 여부 확인"""
-        api_script = self.gpt_sovits_path / "api_v2.py"
-        if not api_script.exists():
-            api_script = self.gpt_sovits_path / "api.py"
-        return self.python_exe.exists() and api_script.exists()
+        """설치 완료 여부 확인 (IS_INSTALLED_TTL 동안 결과 캐시)"""
+        now = time.monotonic()
+        if (
+            self._is_installed_cache is not None
+            and now - self._is_installed_cache[0] < self.IS_INSTALLED_TTL
+        ):
+            return self._is_installed_cache[1]
+
+        # 디렉토리를 한 번 열거해 API 스크립트 유무를 확인 (파일별 stat 대신)
+        try:
+            with os.scandir(self.gpt_sovits_path) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            names = set()
+        has_api = "api_v2.py" in names or "api.py" in names
+        installed = has_api and self.python_exe.exists()
+        self._is_installed_cache = (now, installed)
+        return installed
 
     @staticmethod
     def detect_variant() -> str:
@@ -102,27 +305,60 @@ class GPTSoVITSInstaller:
 
         RTX 50 시리즈(Blackwell, sm_120+)는 nvidia50 패키지 필요.
         """
-        try:
-            import torch
-            if not torch.cuda.is_available():
-                return "standard"
-            props = torch.cuda.get_device_properties(0)
-            gpu_sm = props.major * 10 + props.minor
-            if gpu_sm >= 120:
-                logger.info(
-                    f"GPU sm_{gpu_sm} (Blackwell) 감지 → nvidia50 패키지 권장"
-                )
-                return "nvidia50"
-        except Exception:
-            pass
+        gpu_sm = _local_gpu_sm()
+        if gpu_sm is not None and gpu_sm >= 120:
+            logger.info(
+                f"GPU sm_{gpu_sm} (Blackwell) 감지 → nvidia50 패키지 권장"
+            )
+            return "nvidia50"
         return "standard"
 
     def cancel(self):
-        """설치 취소"""
-        self._cancelled = True
+        """설치 취소 (진행 중인 7z/pip 서브프로세스도 종료)"""
+        self._cancel_event.set()
 
     async def _emit_progress(self, callback: ProgressCallback, progress: InstallProgress):
-        """진행률 콜백 호출 (동기/비동기 모두 지원)"""
+        """진행률 전달 (동기/비동기 콜백 모두 지원)
+
+        stage와 0.5% 단위 진행률이 직전과 같으면 생략합니다. 중간 진행률은
+        슬롯에 최신 값만 남겨 두고 백그라운드 태스크가 최대 20Hz로 전달하며,
+        complete/error는 대기 중인 값을 버리고 즉시 전달합니다.
+        """
+        terminal = progress.stage in ("complete", "error")
+        key = (progress.stage, int(progress.progress * 200))
+        if key == self._last_emit and not terminal:
+            return
+        self._last_emit = key
+
+        if terminal:
+            self._progress_slot = None
+            if self._progress_pump is not None and not self._progress_pump.done():
+                await self._progress_pump  # 전달 중인 값이 종료 알림보다 늦게 가지 않도록
+            await self._dispatch_progress(callback, progress)
+            return
+
+        pending = self._progress_slot
+        if pending is not None and pending[0] is not callback:
+            # 콜백이 바뀌면 이전 콜백의 마지막 값은 먼저 전달
+            self._progress_slot = None
+            await self._dispatch_progress(*pending)
+        self._progress_slot = (callback, progress)
+        if self._progress_pump is None or self._progress_pump.done():
+            self._progress_pump = asyncio.create_task(self._pump_progress())
+
+    async def _pump_progress(self):
+        """슬롯의 최신 진행률을 PROGRESS_PUMP_INTERVAL 간격으로 전달 (비면 종료)"""
+        while (pending := self._progress_slot) is not None:
+            self._progress_slot = None
+            try:
+                await self._dispatch_progress(*pending)
+            except Exception:
+                logger.exception("진행률 콜백 오류")
+            await asyncio.sleep(self.PROGRESS_PUMP_INTERVAL)
+
+    @staticmethod
+    async def _dispatch_progress(callback: ProgressCallback, progress: InstallProgress):
+        """진행률 콜백 호출"""
         result = callback(progress)
         if asyncio.iscoroutine(result):
             await result
@@ -143,7 +379,9 @@ class GPTSoVITSInstaller:
         Returns:
             설치 성공 여부
         """
-        self._cancelled = False
+        self._cancel_event.clear()
+        self._last_emit = (None, -1)
+        self._invalidate_path_cache()
         self._variant = variant or self.detect_variant()
         logger.info(f"설치 패키지 변형: {self._variant}")
 
@@ -151,10 +389,10 @@ class GPTSoVITSInstaller:
             # 설치 디렉토리 생성
             self.install_path.mkdir(parents=True, exist_ok=True)
 
-            # 로그 파일 초기화
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                f.write("GPT-SoVITS 통합 패키지 설치 시작\n")
-                f.write(f"설치 경로: {self.install_path.absolute()}\n\n")
+            # 로그 파일 초기화 (설치 동안 핸들을 열어두고 버퍼링해서 기록)
+            self._log_fh = open(self.log_file, "w", encoding="utf-8", buffering=8192)
+            self._log_fh.write("GPT-SoVITS 통합 패키지 설치 시작\n")
+            self._log_fh.write(f"설치 경로: {self.install_path.absolute()}\n\n")
 
             # 이미 설치되어 있으면 스킵
             if self.is_installed():
@@ -167,17 +405,17 @@ class GPTSoVITSInstaller:
                 return True
 
             # Stage 1: 다운로드 (0-80%)
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 return False
             await self._download_package(on_progress)
 
             # Stage 2: 압축 해제 (80-95%)
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 return False
             await self._extract_package(on_progress)
 
             # Stage 3: 검증 (95-100%)
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 return False
             verify_result = await self._verify_installation(on_progress)
 
@@ -248,15 +486,31 @@ class GPTSoVITSInstaller:
                 error=error_msg
             ))
             return False
+        finally:
+            self._close_log()
+            self._cancel_event.clear()
+            await self.aclose()
 
     def _log(self, message: str):
-        """로그 파일에 기록"""
+        """로그 파일에 기록 (설치 중에는 열린 핸들 사용)"""
         try:
+            if self._log_fh is not None:
+                self._log_fh.write(f"{message}\n")
+                return
             with open(self.log_file, "a", encoding="utf-8") as f:
                 f.write(f"{message}\n")
         except Exception:
             pass
 
+    def _close_log(self):
+        """설치 로그 핸들 닫기"""
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except Exception:
+                pass
+            self._log_fh = None
+
     async def _download_package(self, on_progress: ProgressCallback):
         """통합 패키지 다운로드"""
         variant_info = self.PACKAGE_VARIANTS[self._variant]
@@ -271,11 +525,23 @@ class GPTSoVITSInstaller:
         ))
 
         archive_path = self.install_path / self.ARCHIVE_FILENAME
+        # 다운로드 중에는 .part 파일에 기록하고, 이어받기 상태는 .part.json에 보관
+        part_path = self.install_path / f"{self.ARCHIVE_FILENAME}.part"
+        state_path = self.install_path / f"{self.ARCHIVE_FILENAME}.part.json"
 
-        # 이미 다운로드된 파일이 있으면 스킵
+        expected_sha256 = variant_info.get("sha256")
+
+        # 이미 다운로드된 파일이 있으면 스킵 (SHA-256이 지정된 경우 검증 후)
         if archive_path.exists():
             file_size = archive_path.stat().st_size
-            if file_size >= min_expected_size:
+            if file_size < min_expected_size:
+                # 부분 다운로드된 파일 삭제
+                self._log(f"부분 다운로드 파일 삭제 ({file_size / (1024**3):.1f}GB)")
+                archive_path.unlink()
+            elif expected_sha256 and not await self._verify_archive(archive_path, expected_sha256):
+                self._log("기존 패키지 SHA-256 불일치 — 다시 다운로드")
+                archive_path.unlink()
+            else:
                 self._log(f"이미 다운로드된 패키지 발견 ({file_size / (1024**3):.1f}GB), 스킵")
                 await self._emit_progress(on_progress, InstallProgress(
                     stage="downloading",
@@ -283,79 +549,398 @@ class GPTSoVITSInstaller:
                     message="이미 다운로드된 패키지 사용"
                 ))
                 return
-            else:
-                # 부분 다운로드된 파일 삭제
-                self._log(f"부분 다운로드 파일 삭제 ({file_size / (1024**3):.1f}GB)")
-                archive_path.unlink()
 
         self._log(f"다운로드 시작: {download_url} (variant={self._variant})")
 
-        # 대용량 파일 다운로드를 위한 타임아웃 설정
-        # 각 청크 읽기마다 타임아웃이 갱신되도록 sock_read 사용
-        timeout = aiohttp.ClientTimeout(
-            total=0,        # 전체 타임아웃 비활성화
-            connect=60,     # 연결 타임아웃 60초
-            sock_read=300,  # 각 청크 읽기 타임아웃 5분 (청크마다 갱신됨)
-        )
+        try:
+            session = self._get_session()
+            total, accepts_ranges = await self._probe_download(session, download_url)
+            if total > 0 and accepts_ranges:
+                self._log(f"병렬 다운로드: {self.DOWNLOAD_SEGMENTS}개 구간 ({total / (1024**3):.1f}GB)")
+                await self._download_ranges(
+                    session, download_url, part_path, state_path, total, on_progress,
+                )
+                digest = None
+            else:
+                digest = await self._download_stream(
+                    session, download_url, part_path, state_path, on_progress,
+                )
+        except BaseException:
+            # 부분 파일은 남겨두고 다음 시도에서 이어받음
+            if part_path.exists():
+                self._log("다운로드 중단 — 부분 파일 보존 (재시도 시 이어받기)")
+            raise
+
+        part_path.replace(archive_path)
+        state_path.unlink(missing_ok=True)
+
+        if expected_sha256 and not await self._verify_archive(archive_path, expected_sha256, digest):
+            archive_path.unlink(missing_ok=True)
+            self._log("무결성 검증 실패로 다운로드 파일 삭제")
+            raise Exception("다운로드 파일 무결성 검증 실패 (SHA-256 불일치)")
+
+        self._log(f"다운로드 완료: {archive_path}")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """다운로드용 HTTP 세션 (인스턴스 수명 동안 재사용, keep-alive/DNS 캐시)"""
+        if self._session is None or self._session.closed:
+            # 대용량 파일 다운로드를 위한 타임아웃 설정
+            # 각 청크 읽기마다 타임아웃이 갱신되도록 sock_read 사용
+            timeout = aiohttp.ClientTimeout(
+                total=0,        # 전체 타임아웃 비활성화
+                connect=60,     # 연결 타임아웃 60초
+                sock_read=300,  # 각 청크 읽기 타임아웃 5분 (청크마다 갱신됨)
+            )
+            connector = aiohttp.TCPConnector(
+                limit=self.DOWNLOAD_SEGMENTS * 2,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=timeout, connector=connector, read_bufsize=2**20,
+            )
+        return self._session
+
+    async def aclose(self):
+        """HTTP 세션 닫기"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _verify_archive(
+        self, archive_path: Path, expected_sha256: str, digest: Optional[str] = None,
+    ) -> bool:
+        """아카이브 SHA-256 검증 (digest가 없으면 파일을 읽어 계산)"""
+        if digest is None:
+            loop = asyncio.get_running_loop()
+            digest = await loop.run_in_executor(None, self._hash_file, archive_path)
+        if digest != expected_sha256.lower():
+            self._log(f"SHA-256 불일치: {digest} (기대값 {expected_sha256})")
+            return False
+        self._log("SHA-256 검증 통과")
+        return True
+
+    def _load_download_state(
+        self, state_path: Path, url: str, total: Optional[int] = None,
+    ) -> Optional[list[list[int]]]:
+        """이어받기 상태 로드 (URL/크기가 다르거나 손상되었으면 None)
 
+        total이 None이면 크기는 비교하지 않습니다 (단일 스트림용).
+        """
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(download_url) as resp:
-                    if resp.status != 200:
-                        raise Exception(f"다운로드 실패: HTTP {resp.status}")
-
-                    total = int(resp.headers.get('content-length', 0))
-                    downloaded = 0
-
-                    with open(archive_path, 'wb') as f:
-                        async for chunk in resp.content.iter_chunked(65536):  # 64KB chunks
-                            if self._cancelled:
-                                raise asyncio.CancelledError()
-
-                            f.write(chunk)
-                            downloaded += len(chunk)
-
-                            if total > 0:
-                                file_progress = downloaded / total
-                                overall_progress = file_progress * 0.80  # 다운로드는 전체의 80%
-                                size_mb = downloaded / (1024 * 1024)
-                                total_mb = total / (1024 * 1024)
-                                await self._emit_progress(on_progress, InstallProgress(
-                                    stage="downloading",
-                                    progress=overall_progress,
-                                    message=f"다운로드 중... ({size_mb:.0f}/{total_mb:.0f} MB)"
-                                ))
-
-            self._log(f"다운로드 완료: {archive_path}")
-        except Exception as e:
-            # 다운로드 실패 시 부분 파일 삭제
-            if archive_path.exists():
-                try:
-                    archive_path.unlink()
-                    self._log("다운로드 실패로 부분 파일 삭제")
-                except Exception:
-                    pass
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("url") != url:
+            return None
+        if total is not None and state.get("total") != total:
+            return None
+        segments = state.get("segments")
+        if not isinstance(segments, list):
+            return None
+        return segments
+
+    def _save_download_state(self, state_path: Path, url: str, total: int, segments: list[list[int]]):
+        """이어받기 상태 저장 (구간별 [다음 오프셋, 끝 오프셋])"""
+        try:
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump({"url": url, "total": total, "segments": segments}, f)
+        except OSError as e:
+            self._log(f"이어받기 상태 저장 실패: {e}")
+
+    async def _probe_download(self, session: aiohttp.ClientSession, url: str) -> tuple[int, bool]:
+        """HEAD 요청으로 전체 크기와 Range 지원 여부 확인"""
+        try:
+            async with session.head(url, allow_redirects=True) as resp:
+                if resp.status != 200:
+                    return 0, False
+                total = int(resp.headers.get("content-length", 0))
+                accepts_ranges = resp.headers.get("accept-ranges", "").lower() == "bytes"
+                return total, accepts_ranges
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self._log(f"HEAD 요청 실패, 단일 다운로드 사용: {e}")
+            return 0, False
+
+    async def _report_download(self, on_progress: ProgressCallback, downloaded: int, total: int):
+        """다운로드 진행률 전달 (다운로드는 전체의 0~80%, 최대 5Hz)"""
+        if total <= 0:
+            return
+        now = time.monotonic()
+        if downloaded < total and now - self._last_download_emit < self.DOWNLOAD_PROGRESS_INTERVAL:
+            return
+        self._last_download_emit = now
+        size_mb = downloaded / (1024 * 1024)
+        total_mb = total / (1024 * 1024)
+        await self._emit_progress(on_progress, InstallProgress(
+            stage="downloading",
+            progress=downloaded / total * 0.80,
+            message=f"다운로드 중... ({size_mb:.0f}/{total_mb:.0f} MB)"
+        ))
+
+    async def _download_ranges(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        part_path: Path,
+        state_path: Path,
+        total: int,
+        on_progress: ProgressCallback,
+    ):
+        """Range 요청으로 구간을 나눠 동시에 다운로드
+
+        파일을 전체 크기로 먼저 확장하고, 각 구간은 자신의 오프셋에 기록합니다.
+        중단되면 구간별 진행 오프셋을 저장해 두었다가 이어받습니다.
+        """
+        segments = None
+        if part_path.exists() and part_path.stat().st_size == total:
+            segments = self._load_download_state(state_path, url, total)
+
+        if segments is not None:
+            remaining = sum(end - pos + 1 for pos, end in segments if pos <= end)
+            self._log(f"이어받기: {(total - remaining) / (1024**3):.1f}GB 완료된 상태에서 재개")
+        else:
+            segment_size = -(-total // self.DOWNLOAD_SEGMENTS)
+            segments = [
+                [start, min(start + segment_size, total) - 1]
+                for start in range(0, total, segment_size)
+            ]
+            with open(part_path, "wb") as f:
+                self._preallocate(f, total)
+            # 할당 직후 상태를 기록해 두어야 강제 종료 시에도 처음부터 안전하게 재개
+            self._save_download_state(state_path, url, total, segments)
+
+        loop = asyncio.get_running_loop()
+        downloaded = total - sum(end - pos + 1 for pos, end in segments if pos <= end)
+
+        async def fetch_range(segment: list[int]):
+            nonlocal downloaded
+            start, end = segment
+            headers = {"Range": f"bytes={start}-{end}"}
+            async with session.get(url, headers=headers) as resp:
+                if resp.status != 206:
+                    raise Exception(f"구간 다운로드 실패: HTTP {resp.status} (bytes={start}-{end})")
+
+                # 구간마다 별도 핸들 사용 (pwrite는 Windows 미지원)
+                with open(part_path, "r+b", buffering=self.WRITE_BUFFER_SIZE) as f:
+                    f.seek(start)
+                    async for chunk in resp.content.iter_any():
+                        if self._cancel_event.is_set():
+                            raise asyncio.CancelledError()
+
+                        await loop.run_in_executor(None, f.write, chunk)
+                        segment[0] += len(chunk)
+                        downloaded += len(chunk)
+                        await self._report_download(on_progress, downloaded, total)
+
+                    await loop.run_in_executor(None, f.flush)
+                    await loop.run_in_executor(None, os.fsync, f.fileno())
+
+        tasks = [
+            asyncio.create_task(fetch_range(segment))
+            for segment in segments
+            if segment[0] <= segment[1]
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 한 구간이라도 실패하면 나머지 구간도 중단하고 진행 상태 저장
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._save_download_state(state_path, url, total, segments)
             raise
 
-    def _find_7z_executable(self) -> Path | None:
-        """시스템에 설치된 7z.exe 찾기"""
-        # 일반적인 7-Zip 설치 경로
+        if downloaded != total:
+            raise Exception(f"다운로드 크기 불일치 ({downloaded}/{total} bytes)")
+
+    async def _download_stream(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        part_path: Path,
+        state_path: Path,
+        on_progress: ProgressCallback,
+    ) -> Optional[str]:
+        """단일 GET 스트림 다운로드 (Range 미지원 서버용)
+
+        이어받기 상태가 있으면 `Range: bytes={offset}-`로 이어받기를 시도하고,
+        서버가 206 대신 200을 주면 처음부터 다시 받습니다.
+
+        Returns:
+            처음부터 받은 경우 SHA-256 hex digest, 이어받은 경우 None
+        """
+        resume_from = 0
+        if part_path.exists():
+            segments = self._load_download_state(state_path, url)
+            if segments:
+                resume_from = min(segments[0][0], part_path.stat().st_size)
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else None
+
+        async with session.get(url, headers=headers) as resp:
+            if resp.status not in (200, 206):
+                raise Exception(f"다운로드 실패: HTTP {resp.status}")
+
+            if resp.status == 200:
+                resume_from = 0
+            else:
+                self._log(f"이어받기: {resume_from / (1024**3):.1f}GB부터 재개")
+
+            content_length = int(resp.headers.get('content-length', 0))
+            total = resume_from + content_length if content_length else 0
+            downloaded = resume_from
+            # 쓰기와 같은 패스에서 해시 계산 (별도 검증 읽기 불필요)
+            hasher = hashlib.sha256()
+
+            written = resume_from  # 실제로 파일에 기록한 끝 오프셋
+
+            def write_chunk(chunk: bytes):
+                nonlocal written
+                f.write(chunk)
+                hasher.update(chunk)
+                written += len(chunk)
+
+            # 디스크 쓰기/해시는 별도 writer 태스크가 executor에서 처리
+            # (네트워크 수신이 디스크 지연에 막히지 않도록 bounded queue로 분리)
+            loop = asyncio.get_running_loop()
+            write_q: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+
+            async def writer():
+                while (chunk := await write_q.get()) is not None:
+                    await loop.run_in_executor(None, write_chunk, chunk)
+
+            # 수신 청크를 8MB 단위로 모아 커널에 기록 (대용량 순차 쓰기)
+            # 새로 받을 때는 전체 크기를 미리 할당 (이어받기는 기록 오프셋으로 이동)
+            if resume_from:
+                raw = open(part_path, 'r+b', buffering=0)
+                raw.seek(resume_from)
+            else:
+                raw = open(part_path, 'wb', buffering=0)
+                if total:
+                    self._preallocate(raw, total)
+            f = io.BufferedWriter(raw, buffer_size=self.WRITE_BUFFER_SIZE)
+            writer_task = asyncio.create_task(writer())
+            try:
+                async for chunk in resp.content.iter_any():
+                    if self._cancel_event.is_set():
+                        raise asyncio.CancelledError()
+                    if writer_task.done():
+                        break  # 쓰기 오류 → 아래에서 예외 전파
+
+                    await write_q.put(chunk)
+                    downloaded += len(chunk)
+                    await self._report_download(on_progress, downloaded, total)
+
+                if not writer_task.done():
+                    await write_q.put(None)
+                await writer_task
+
+                await loop.run_in_executor(None, f.flush)
+                await loop.run_in_executor(None, os.fsync, raw.fileno())
+            except BaseException:
+                # 대기 중인 청크는 버리고 진행 중인 쓰기만 끝낸 뒤 기록 위치 저장
+                if not writer_task.done():
+                    while not write_q.empty():
+                        write_q.get_nowait()
+                    write_q.put_nowait(None)
+                    await asyncio.gather(writer_task, return_exceptions=True)
+                f.close()
+                self._save_download_state(state_path, url, total, [[written, total - 1]])
+                raise
+            f.close()
+
+            if total and written != total:
+                self._save_download_state(state_path, url, total, [[written, total - 1]])
+                raise Exception(f"다운로드 크기 불일치 ({written}/{total} bytes)")
+
+        return None if resume_from else hasher.hexdigest()
+
+    @staticmethod
+    def _preallocate(f, size: int):
+        """파일을 size 바이트로 미리 할당 (단편화/반복 확장 방지)
+
+        POSIX는 posix_fallocate로 실제 블록을 예약하고, Windows는
+        truncate(SetEndOfFile)로 한 번에 파일 크기를 확장합니다.
+        """
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+                return
+            except OSError:
+                pass  # 미지원 파일시스템 → truncate로 폴백
+        f.truncate(size)
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """파일의 SHA-256 hex digest 계산
+
+        Python 3.11+에서는 hashlib.file_digest를 사용합니다
+        (OpenSSL 구현 — SHA-NI 지원 CPU에서 하드웨어 가속).
+        """
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            hasher = hashlib.sha256()
+            while chunk := f.read(8 * 1024 * 1024):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+    async def _find_7z_executable(self) -> Path | None:
+        """시스템에 설치된 7-Zip 실행 파일 찾기
+
+        7z/7zz/7za 후보 중 버전이 가장 높은 것을 선택합니다.
+        (7-Zip 24+는 LZMA2 멀티스레드 압축 해제가 개선됨)
+        """
+        # PATH 우선, 이후 일반적인 7-Zip 설치 경로
         candidates = [
+            Path(found)
+            for name in ("7zz", "7z", "7za")
+            if (found := shutil.which(name))
+        ]
+        candidates += [
             Path("C:/Program Files/7-Zip/7z.exe"),
             Path("C:/Program Files (x86)/7-Zip/7z.exe"),
+            Path("C:/Program Files/7-Zip-Zstd/7z.exe"),
+            Path("/usr/local/bin/7zz"),
         ]
 
-        # PATH에서도 찾기
-        import shutil as sh
-        path_7z = sh.which("7z")
-        if path_7z:
-            candidates.insert(0, Path(path_7z))
-
+        best: Path | None = None
+        best_version: tuple[int, int] = (-1, -1)
+        seen: set[Path] = set()
         for candidate in candidates:
-            if candidate.exists():
-                return candidate
+            if candidate in seen or not candidate.exists():
+                continue
+            seen.add(candidate)
+            version = await self._probe_7z_version(candidate)
+            if best is None or version > best_version:
+                best, best_version = candidate, version
+            if version >= (24, 0):
+                break
+
+        if best is None:
+            self._log("7-Zip을 찾을 수 없음 (winget install 7zip.7zip 설치 시 더 빠름)")
+            return None
+
+        version_label = (
+            f"{best_version[0]}.{best_version[1]:02d}" if best_version[0] >= 0 else "unknown"
+        )
+        logger.info(f"7-Zip 선택: {best} (버전 {version_label})")
+        self._log(f"7-Zip 선택: {best} (버전 {version_label})")
+        return best
 
-        return None
+    @staticmethod
+    async def _probe_7z_version(executable: Path) -> tuple[int, int]:
+        """7-Zip 실행 파일의 버전 조회 (실패 시 (-1, -1))"""
+        try:
+            _, stdout, _ = await _run([str(executable), "--help"], timeout=10)
+        except Exception:
+            return (-1, -1)
+
+        # 예: "7-Zip 24.08 (x64)", "7-Zip [64] 16.02", "7-Zip (a) 23.01"
+        match = _SEVEN_ZIP_VERSION_RE.search(stdout)
+        if not match:
+            return (-1, -1)
+        return (int(match.group(1)), int(match.group(2)))
 
     async def _extract_package(self, on_progress: ProgressCallback):
         """패키지 압축 해제 (7z 형식)"""
@@ -371,7 +956,10 @@ class GPTSoVITSInstaller:
         ))
 
         # 7z.exe 우선 사용 (훨씬 빠름)
-        seven_zip = self._find_7z_executable()
+        # 참고: 다운로드 스트림을 `7z x -si`로 바로 넘기는 방식은 쓸 수 없음.
+        # 7z 형식은 헤더가 아카이브 끝에 있어 임의 접근이 필요하므로
+        # 7-Zip이 stdin에서 .7z를 풀지 못함 → 디스크의 아카이브 파일을 사용
+        seven_zip = await self._find_7z_executable()
 
         if seven_zip:
             self._log(f"7-Zip 사용: {seven_zip}")
@@ -396,39 +984,72 @@ class GPTSoVITSInstaller:
         ))
 
     async def _extract_with_7z(self, archive_path: Path, seven_zip: Path, on_progress: ProgressCallback):
-        """7z.exe를 사용한 빠른 압축 해제"""
+        """7z.exe를 사용한 빠른 압축 해제
+
+        -bsp1 진행률 출력을 스트리밍으로 읽어 80~95% 구간에 매핑합니다.
+        """
         self._log("7z.exe로 압축 해제 시작...")
 
-        def extract_sync():
-            # 7z x archive.7z -ooutput_dir -y
-            # -y: 모든 질문에 Yes
-            # -bsp1: 진행률 출력 (stdout)
-            result = subprocess.run(
-                [
-                    str(seven_zip),
-                    "x",  # extract with full paths
-                    str(archive_path),
-                    f"-o{self.install_path}",
-                    "-y",  # assume Yes on all queries
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
+        # 7z x archive.7z -ooutput_dir -y -mmt=on -bsp1
+        # -y: 모든 질문에 Yes
+        # -mmt=on: LZMA2 멀티스레드 압축 해제
+        # -bsp1: 진행률 출력 (stdout, 백스페이스로 갱신되므로 줄 단위가 아님)
+        process = await asyncio.create_subprocess_exec(
+            str(seven_zip),
+            "x",  # extract with full paths
+            str(archive_path),
+            f"-o{self.install_path}",
+            "-y",  # assume Yes on all queries
+            "-mmt=on",
+            "-bsp1",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+        tail = b""  # 마지막 출력 (오류 메시지용)
+        last_percent = -1
+        watcher = asyncio.create_task(self._terminate_on_cancel(process))
+        try:
+            while True:
+                data = await process.stdout.read(4096)  # type: ignore
+                if not data:
+                    break
+                # 청크 경계에서 잘린 "37%" 같은 표기도 잡도록 이전 꼬리와 합쳐서 검색
+                matches = _SEVEN_ZIP_PERCENT_RE.findall(tail[-4:] + data)
+                tail = (tail + data)[-2000:]
+                if not matches:
+                    continue
+                percent = min(int(matches[-1]), 100)
+                if percent == last_percent:
+                    continue
+                last_percent = percent
+                await self._emit_progress(on_progress, InstallProgress(
+                    stage="extracting",
+                    progress=0.80 + percent / 100 * 0.15,
+                    message=f"압축 해제 중... ({percent}%)"
+                ))
 
-            if result.returncode != 0:
-                raise Exception(f"7z 압축 해제 실패: {result.stderr}")
+            await process.wait()
+        finally:
+            watcher.cancel()
+            await self._terminate_process(process)
 
-            return result.stdout
+        if self._cancel_event.is_set():
+            raise asyncio.CancelledError()
 
-        loop = asyncio.get_event_loop()
-        output = await loop.run_in_executor(None, extract_sync)
-        self._log(f"7z.exe 출력: {output[:500] if output else '(없음)'}")
+        output = tail.decode("utf-8", errors="replace").strip()
+        if process.returncode != 0:
+            raise Exception(f"7z 압축 해제 실패: {output[-500:]}")
+
+        self._log(f"7z.exe 출력: {output[-500:] if output else '(없음)'}")
 
     async def _extract_with_py7zr(self, archive_path: Path, on_progress: ProgressCallback):
-        """py7zr 라이브러리를 사용한 압축 해제 (폴백, 느림)"""
-        self._log("py7zr로 압축 해제 시작 (7-Zip이 설치되어 있으면 더 빠릅니다)...")
+        """라이브러리를 사용한 압축 해제 (폴백, 느림)
+
+        libarchive(python-libarchive-c)가 있으면 C 디코더를 사용하고,
+        없으면 py7zr를 사용합니다.
+        """
+        self._log("라이브러리로 압축 해제 시작 (7-Zip이 설치되어 있으면 더 빠릅니다)...")
 
         await self._emit_progress(on_progress, InstallProgress(
             stage="extracting",
@@ -436,13 +1057,53 @@ class GPTSoVITSInstaller:
             message="압축 해제 중... (7-Zip 설치 시 더 빠름)"
         ))
 
-        def extract_sync():
-            with py7zr.SevenZipFile(archive_path, mode='r') as archive:
-                all_files = archive.getnames()
-                self._log(f"총 {len(all_files)}개 파일 압축 해제 예정")
-                archive.extractall(path=self.install_path)
+        try:
+            import libarchive
+        except ImportError:
+            libarchive = None
+
+        def extract_with_libarchive():
+            # extract_file은 현재 작업 디렉토리에 풀어놓으므로 사용하지 않음
+            # (os.chdir은 서버 프로세스 전체의 상대 경로 해석을 바꿈)
+            # 항목마다 install_path 기준 경로를 직접 계산해 기록
+            root = self.install_path.resolve()
+            with libarchive.file_reader(str(archive_path)) as archive:
+                for entry in archive:
+                    parts = _archive_member_parts(entry.pathname)
+                    if not parts:
+                        continue  # "./" 같은 루트 항목
+                    target = root.joinpath(*parts)
+                    if entry.isdir:
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    if not entry.isfile:
+                        continue  # 링크/장치 파일 등은 통합 패키지에 필요 없음
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with open(target, "wb") as f:
+                        for block in entry.get_blocks():
+                            f.write(block)
+
+        if libarchive is not None:
+            self._log("libarchive 사용")
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, extract_with_libarchive)
+            return
+
+        self._log("py7zr 사용")
 
-        loop = asyncio.get_event_loop()
+        def extract_sync():
+            # 아카이브를 mmap으로 열어 커널이 순차 프리페치하도록 함
+            with open(archive_path, "rb") as raw, \
+                    mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                reader = io.BufferedReader(_MmapReader(mm))
+                with py7zr.SevenZipFile(reader, mode='r') as archive:
+                    # getnames()로 이름 목록을 만들지 않고 파싱된 헤더의 항목 수만 사용
+                    self._log(f"총 {len(archive.files)}개 파일 압축 해제 예정")
+                    archive.extractall(path=self.install_path)
+
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, extract_sync)
 
     async def _verify_installation(self, on_progress: ProgressCallback) -> bool:
@@ -453,6 +1114,9 @@ class GPTSoVITSInstaller:
             message="설치 검증 중..."
         ))
 
+        # 압축 해제로 폴더가 새로 생겼으므로 캐시된 경로/상태를 버림
+        self._invalidate_path_cache()
+
         # 1. Python 실행 파일 확인
         if not self.python_exe.exists():
             self._log(f"검증 실패: {self.python_exe} 없음")
@@ -485,36 +1149,26 @@ class GPTSoVITSInstaller:
             "gpt_sovits_path": str(self.gpt_sovits_path.absolute()) if self.gpt_sovits_path.exists() else None,
         }
 
-        # 설치되어 있으면 추가 정보
+        # 설치되어 있으면 추가 정보 (런타임 torch 정보 1회 조회)
         if info["is_installed"]:
-            try:
-                result = subprocess.run(
-                    [str(self.python_exe), "-c", "import torch; print(torch.__version__)"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    encoding="utf-8",
-                    errors="replace"
-                )
-                if result.returncode == 0:
-                    info["torch_version"] = result.stdout.strip()
-
-                result = subprocess.run(
-                    [str(self.python_exe), "-c", "import torch; print(torch.cuda.is_available())"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    encoding="utf-8",
-                    errors="replace"
-                )
-                if result.returncode == 0:
-                    info["cuda_available"] = result.stdout.strip() == "True"
-            except Exception:
-                pass
+            torch_info = await self._query_torch_info()
+            if torch_info:
+                info["torch_version"] = torch_info.get("version")
+                info["cuda_available"] = torch_info.get("cuda_available")
 
         return info
 
     PYTORCH_INDEX_URL = "https://download.pytorch.org/whl/cu128"
+    # PyTorch 업그레이드용 pip 옵션
+    # - 휠만 사용, pip 캐시 미사용
+    # - --force-reinstall 대신 --upgrade: 같은 버전이면 재다운로드하지 않음
+    # - 종속성 해석은 유지 (torch 버전이 바뀌면 요구 패키지도 바뀜)
+    PYTORCH_PIP_FLAGS = (
+        "--upgrade",
+        "--prefer-binary",
+        "--only-binary=:all:",
+        "--no-cache-dir",
+    )
 
     async def _needs_pytorch_upgrade(self) -> bool:
         """현재 GPU가 GPT-SoVITS 번들 PyTorch와 호환되지 않는지 확인.
@@ -522,33 +1176,21 @@ class GPTSoVITSInstaller:
         ArkSynth 쪽 torch를 사용하여 GPU compute capability를 조회하고,
         GPT-SoVITS 런타임의 PyTorch arch_list와 비교합니다.
         """
-        try:
-            import torch
-            if not torch.cuda.is_available():
-                return False
-            props = torch.cuda.get_device_properties(0)
-            gpu_sm = props.major * 10 + props.minor
-        except Exception:
+        gpu_sm = _local_gpu_sm()
+        if gpu_sm is None:
             return False
 
         # GPT-SoVITS 런타임의 PyTorch가 이 GPU를 지원하는지 확인
+        # (get_pytorch_info는 TORCH_INFO_TTL 동안 캐시됨)
         gpt_info = await self.get_pytorch_info()
-        arch_list = gpt_info.get("arch_list", [])
-        if not arch_list:
+        max_sm = _max_supported_sm(tuple(gpt_info.get("arch_list") or ()))
+        if max_sm is None:
             return False  # 판단 불가 시 업그레이드 안 함
 
-        supported = [
-            int(a.replace("sm_", "").rstrip("a"))
-            for a in arch_list
-            if a.startswith("sm_")
-        ]
-        if not supported:
-            return False
-
-        needs = gpu_sm > max(supported)
+        needs = gpu_sm > max_sm
         if needs:
             logger.info(
-                f"GPU sm_{gpu_sm} > PyTorch max sm_{max(supported)} "
+                f"GPU sm_{gpu_sm} > PyTorch max sm_{max_sm} "
                 f"— PyTorch 업그레이드 필요"
             )
         return needs
@@ -561,30 +1203,42 @@ class GPTSoVITSInstaller:
             "arch_list": [],
             "compatible": None,
         }
+        torch_info = await self._query_torch_info()
+        for key in ("version", "cuda_version", "arch_list"):
+            if key in torch_info:
+                info[key] = torch_info[key]
+        return info
+
+    async def _query_torch_info(self) -> dict:
+        """GPT-SoVITS runtime의 torch 정보를 한 번의 서브프로세스로 조회
+
+        버전/CUDA 가용성/arch_list/GPU sm을 한 번에 가져오고
+        TORCH_INFO_TTL 동안 캐시합니다. 실패 시 빈 dict (캐시하지 않음).
+        """
+        if (
+            self._torch_info is not None
+            and time.monotonic() - self._torch_info_ts < self.TORCH_INFO_TTL
+        ):
+            return self._torch_info
+
         if not self.python_exe.exists():
-            return info
-
-        script = (
-            "import torch; import json; "
-            "al = []; "
-            "try:\n al = torch.cuda.get_arch_list()\nexcept: pass\n"
-            "cv = getattr(torch.version, 'cuda', None); "
-            "print(json.dumps({'version': torch.__version__, "
-            "'cuda_version': cv, 'arch_list': al}))"
-        )
+            return {}
+
         try:
-            result = subprocess.run(
-                [str(self.python_exe), "-c", script],
-                capture_output=True, text=True, timeout=60,
-                encoding="utf-8", errors="replace",
+            returncode, stdout, _ = await _run(
+                [str(self.python_exe), "-c", _TORCH_INFO_SCRIPT], timeout=60,
             )
-            if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout.strip())
-                info.update(data)
+            if returncode != 0:
+                return {}
+            lines = stdout.strip().splitlines()
+            data = json.loads(lines[-1]) if lines else {}
         except Exception as e:
             logger.warning(f"PyTorch 정보 조회 실패: {e}")
-        return info
+            return {}
+
+        self._torch_info = data
+        self._torch_info_ts = time.monotonic()
+        return data
 
     async def upgrade_pytorch(self, on_progress: ProgressCallback) -> bool:
         """GPT-SoVITS runtime의 PyTorch를 cu128로 업그레이드"""
@@ -612,49 +1266,20 @@ class GPTSoVITSInstaller:
         ))
         cmd = [
             str(self.python_exe), "-m", "pip", "install",
+            *self.PYTORCH_PIP_FLAGS,
             "torch", "torchvision", "torchaudio",
             "--index-url", self.PYTORCH_INDEX_URL,
-            "--force-reinstall",
         ]
         logger.info(f"PyTorch 업그레이드 명령: {' '.join(cmd)}")
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
+            returncode, tail_lines = await self._run_pip(
+                cmd, on_progress, _PIP_STAGE_PROGRESS_GPT, "pip",
                 cwd=str(self.gpt_sovits_path),
             )
-
-            lines_buffer: list[str] = []
-            while True:
-                line_bytes = await process.stdout.readline()  # type: ignore
-                if not line_bytes:
-                    break
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
-                lines_buffer.append(line)
-                logger.debug(f"[pip] {line}")
-
-                # pip 진행률 파싱 (Downloading/Installing 등)
-                progress = 0.05
-                if "Downloading" in line or "downloading" in line:
-                    progress = 0.3
-                elif "Installing" in line or "installing" in line:
-                    progress = 0.7
-                elif "Successfully" in line:
-                    progress = 0.85
-
-                await self._emit_progress(on_progress, InstallProgress(
-                    stage="upgrading", progress=progress,
-                    message=line[:200],
-                ))
-
-            await process.wait()
-            if process.returncode != 0:
-                tail = "\n".join(lines_buffer[-10:])
-                logger.error(f"PyTorch 업그레이드 실패 (exit {process.returncode})")
+            if returncode != 0:
+                tail = "\n".join(tail_lines)
+                logger.error(f"PyTorch 업그레이드 실패 (exit {returncode})")
                 await self._emit_progress(on_progress, InstallProgress(
                     stage="error", progress=0,
                     message="PyTorch 업그레이드 실패",
@@ -675,6 +1300,7 @@ class GPTSoVITSInstaller:
             stage="verifying", progress=0.90,
             message="업그레이드 검증 중...",
         ))
+        self._torch_info = None  # 업그레이드 후 캐시 무효화
         new_info = await self.get_pytorch_info()
         new_ver = new_info.get("version", "unknown")
         arch_list = new_info.get("arch_list", [])
@@ -696,46 +1322,21 @@ class GPTSoVITSInstaller:
 
         cmd = [
             sys.executable, "-m", "pip", "install",
+            *self.PYTORCH_PIP_FLAGS,
             "torch", "torchvision", "torchaudio",
             "--index-url", self.PYTORCH_INDEX_URL,
         ]
         logger.info(f"ArkSynth PyTorch 업그레이드 명령: {' '.join(cmd)}")
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
+            returncode, _ = await self._run_pip(
+                cmd, on_progress, _PIP_STAGE_PROGRESS_ARKSYNTH, "pip-arksynth",
             )
-
-            while True:
-                line_bytes = await process.stdout.readline()  # type: ignore
-                if not line_bytes:
-                    break
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
-                logger.debug(f"[pip-arksynth] {line}")
-
-                progress = 0.1
-                if "Downloading" in line or "downloading" in line:
-                    progress = 0.4
-                elif "Installing" in line or "installing" in line:
-                    progress = 0.7
-                elif "Successfully" in line:
-                    progress = 0.9
-
-                await self._emit_progress(on_progress, InstallProgress(
-                    stage="upgrading", progress=progress,
-                    message=line[:200],
-                ))
-
-            await process.wait()
-            if process.returncode != 0:
+            if returncode != 0:
                 await self._emit_progress(on_progress, InstallProgress(
                     stage="error", progress=0,
                     message="ArkSynth PyTorch 업그레이드 실패",
-                    error=f"pip exit code: {process.returncode}",
+                    error=f"pip exit code: {returncode}",
                 ))
                 return False
         except Exception as e:
@@ -752,14 +1353,126 @@ class GPTSoVITSInstaller:
         ))
         return True
 
-    def cleanup(self):
-        """설치 폴더 정리 (삭제)"""
+    async def _terminate_on_cancel(self, process: asyncio.subprocess.Process):
+        """취소 이벤트가 설정되면 서브프로세스 종료"""
+        await self._cancel_event.wait()
+        await self._terminate_process(process)
+
+    @staticmethod
+    async def _terminate_process(process: asyncio.subprocess.Process, grace: float = 2.0):
+        """실행 중인 서브프로세스 종료 (terminate → grace초 후 kill)"""
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=grace)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def _run_pip(
+        self,
+        cmd: list[str],
+        on_progress: ProgressCallback,
+        stage_progress: dict[bytes, float],
+        log_tag: str,
+        cwd: Optional[str] = None,
+    ) -> tuple[int, list[str]]:
+        """pip 실행 및 출력 기반 진행률 전달
+
+        출력 줄을 정규식 하나로 검사해 단계(Downloading/Installing/Successfully)를
+        판별하고, 진행률 값이 바뀔 때만 콜백을 호출합니다.
+
+        Returns:
+            (returncode, 마지막 출력 10줄)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+        )
+
+        tail: deque[bytes] = deque(maxlen=10)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        last_progress: Optional[float] = None
+        watcher = asyncio.create_task(self._terminate_on_cancel(process))
+        try:
+            while True:
+                line_bytes = await process.stdout.readline()  # type: ignore
+                if not line_bytes:
+                    break
+                line_bytes = line_bytes.strip()
+                if not line_bytes:
+                    continue
+                tail.append(line_bytes)
+                if debug:
+                    logger.debug(f"[{log_tag}] {line_bytes.decode('utf-8', errors='replace')}")
+
+                match = _PIP_STAGE_RE.search(line_bytes)
+                if not match:
+                    continue
+                progress = stage_progress[match.group(1).lower()]
+                if progress == last_progress:
+                    continue
+                last_progress = progress
+                await self._emit_progress(on_progress, InstallProgress(
+                    stage="upgrading", progress=progress,
+                    message=line_bytes[:200].decode("utf-8", errors="replace"),
+                ))
+
+            await process.wait()
+        finally:
+            watcher.cancel()
+            await self._terminate_process(process)
+
+        if self._cancel_event.is_set():
+            raise asyncio.CancelledError()
+
+        return process.returncode, [b.decode("utf-8", errors="replace") for b in tail]
+
+    async def cleanup(self):
+        """설치 폴더 정리 (삭제)
+
+        수만 개 파일을 파이썬에서 하나씩 지우면 느리므로 OS 명령을 우선 사용합니다.
+        - Windows: 빈 폴더를 robocopy /MIR /MT:32로 미러링 (멀티스레드 삭제)
+        - 그 외: rm -rf
+        실패하면 shutil.rmtree(executor)로 폴백합니다.
+        """
+        await self.aclose()
+        self._invalidate_path_cache()
+        if not self.install_path.exists():
+            return
+
+        target = str(self.install_path.absolute())
+        try:
+            if sys.platform == "win32":
+                empty_dir = tempfile.mkdtemp(prefix="arksynth_empty_")
+                try:
+                    # robocopy 종료 코드는 0~7이 성공이므로 결과 코드는 보지 않음
+                    await _run(
+                        ["robocopy", empty_dir, target, "/MIR", "/MT:32",
+                         "/NFL", "/NDL", "/NJH", "/NJS", "/NP"],
+                        timeout=1800,
+                    )
+                finally:
+                    os.rmdir(empty_dir)
+                os.rmdir(target)
+            else:
+                await _run(["rm", "-rf", target], timeout=1800)
+        except Exception as e:
+            logger.debug(f"OS 삭제 명령 실패, rmtree로 폴백: {e}")
+
         if self.install_path.exists():
             try:
-                shutil.rmtree(self.install_path)
-                logger.info(f"설치 폴더 삭제: {self.install_path}")
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, shutil.rmtree, self.install_path)
             except Exception as e:
                 logger.error(f"정리 실패: {e}")
+                return
+        logger.info(f"설치 폴더 삭제: {self.install_path}")
 
 
 # 전역 인스턴스
@@ -2,16 +2,54 @@
 
 import json
 import logging
-from dataclasses import dataclass, asdict
+import os
+import time
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from .config import GPTSoVITSConfig
 
+# JSON 직렬화: orjson > ujson > 표준 json 순으로 사용 (모두 선택적 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _read_json(path: Path) -> dict:
+    """JSON 파일 읽기 (한 번의 read로 로드)"""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: dict):
+    """JSON 파일 쓰기 (인코딩 후 한 번의 write)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    elif ujson is not None:
+        path.write_text(
+            ujson.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    else:
+        path.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+
+@dataclass(slots=True)
 class ModelInfo:
     """학습된 모델 정보"""
 
@@ -30,15 +68,77 @@ class ModelInfo:
         return cls(**data)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # asdict()는 호출마다 fields()를 순회하며 deepcopy하므로 직접 구성
+        return {
+            "char_id": self.char_id,
+            "char_name": self.char_name,
+            "trained_at": self.trained_at,
+            "epochs_sovits": self.epochs_sovits,
+            "epochs_gpt": self.epochs_gpt,
+            "ref_audio_count": self.ref_audio_count,
+            "language": self.language,
+            "has_sovits": self.has_sovits,
+            "has_gpt": self.has_gpt,
+        }
 
 
 class GPTSoVITSModelManager:
     """GPT-SoVITS 모델 파일 관리자"""
 
+    # 파일 존재 여부 캐시 유지 시간 (초, UI 폴링 시 stat 반복 방지)
+    STAT_CACHE_TTL = 1.0
+
     def __init__(self, config: GPTSoVITSConfig | None = None):
         self.config = config or GPTSoVITSConfig()
         self.config.ensure_directories()
+        # 경로 -> (확인 시각, 존재 여부). 없는 경로도 캐시 (negative cache)
+        self._stat_cache: dict[str, tuple[float, bool]] = {}
+        # (char_id, lang) -> (config.json mtime_ns, ModelInfo). 변경 없으면 재파싱 생략
+        self._info_cache: dict[tuple[str, str], tuple[int, ModelInfo]] = {}
+        # (char_id, lang) -> 미리 구성한 모델 파일 경로
+        self._paths: dict[tuple[str, str], dict[str, Path]] = {}
+
+    def _paths_for(self, char_id: str, lang: str) -> dict[str, Path]:
+        """캐릭터별 모델 파일 경로 (최초 호출 시 구성 후 재사용)"""
+        key = (char_id, lang)
+        paths = self._paths.get(key)
+        if paths is None:
+            model_dir = self.config.get_model_path(char_id, lang)
+            paths = {
+                "model": model_dir,
+                "sovits": self.config.get_sovits_model_path(char_id, lang),
+                "gpt": self.config.get_gpt_model_path(char_id, lang),
+                "config": self.config.get_config_path(char_id, lang),
+                "info": model_dir / "info.json",
+                "ref_audio": self.config.get_ref_audio_path(char_id, lang),
+                "ref_text": self.config.get_ref_text_path(char_id, lang),
+                "preprocessed": self.config.get_preprocessed_audio_path(char_id, lang),
+            }
+            self._paths[key] = paths
+        return paths
+
+    def _exists_cached(self, path: Path) -> bool:
+        """TTL 캐시를 거친 path.exists()"""
+        key = str(path)
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < self.STAT_CACHE_TTL:
+            return cached[1]
+        try:
+            os.stat(key)
+            exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            exists = False
+        self._stat_cache[key] = (now, exists)
+        return exists
+
+    def _invalidate_stat_cache(self):
+        """모델 파일 변경 후 존재 여부 캐시 무효화"""
+        self._stat_cache.clear()
+
+    def _invalidate_info_cache(self, char_id: str, lang: str):
+        """캐릭터 모델 정보 캐시 무효화"""
+        self._info_cache.pop((char_id, lang), None)
 
     def _lang(self, lang: str | None = None) -> str:
         """lang이 None이면 config.default_language 사용"""
@@ -49,33 +149,36 @@ class GPTSoVITSModelManager:
         lang = self._lang(lang)
         if self.is_zero_shot_ready(char_id, lang):
             return True
-        sovits_path = self.config.get_sovits_model_path(char_id, lang)
-        gpt_path = self.config.get_gpt_model_path(char_id, lang)
-        return sovits_path.exists() and gpt_path.exists()
+        paths = self._paths_for(char_id, lang)
+        sovits_path = paths["sovits"]
+        gpt_path = paths["gpt"]
+        return self._exists_cached(sovits_path) and self._exists_cached(gpt_path)
 
     def is_zero_shot_ready(self, char_id: str, lang: str | None = None) -> bool:
         """Zero-shot 합성 준비 여부 (참조 오디오만 필요)"""
         lang = self._lang(lang)
         # 새 구조: preprocessed 폴더 + info.json 확인
-        preprocessed_dir = self.config.get_preprocessed_audio_path(char_id, lang)
-        info_path = self.config.get_model_path(char_id, lang) / "info.json"
-        if preprocessed_dir.exists() and info_path.exists():
+        paths = self._paths_for(char_id, lang)
+        preprocessed_dir = paths["preprocessed"]
+        info_path = paths["info"]
+        if self._exists_cached(preprocessed_dir) and self._exists_cached(info_path):
             wav_files = list(preprocessed_dir.glob("*.wav"))
             txt_files = list(preprocessed_dir.glob("*.txt"))
             if wav_files and txt_files:
                 return True
 
         # 레거시 구조: ref.wav + ref.txt 확인
-        ref_audio = self.config.get_ref_audio_path(char_id, lang)
-        ref_text = self.config.get_ref_text_path(char_id, lang)
-        return ref_audio.exists() and ref_text.exists()
+        ref_audio = paths["ref_audio"]
+        ref_text = paths["ref_text"]
+        return self._exists_cached(ref_audio) and self._exists_cached(ref_text)
 
     def has_trained_model(self, char_id: str, lang: str | None = None) -> bool:
         """전체 학습된 모델이 있는지 (zero-shot이 아닌)"""
         lang = self._lang(lang)
-        sovits_path = self.config.get_sovits_model_path(char_id, lang)
-        gpt_path = self.config.get_gpt_model_path(char_id, lang)
-        return sovits_path.exists() and gpt_path.exists()
+        paths = self._paths_for(char_id, lang)
+        sovits_path = paths["sovits"]
+        gpt_path = paths["gpt"]
+        return self._exists_cached(sovits_path) and self._exists_cached(gpt_path)
 
     def get_model_type(self, char_id: str, lang: str | None = None) -> str:
         """모델 타입 조회: "none" / "prepared" / "finetuned" """
@@ -93,28 +196,83 @@ class GPTSoVITSModelManager:
         if not lang_path.exists():
             return []
 
+        # 판정에 쓰이는 파일명 (config 경로 규칙에서 한 번만 도출)
+        names = {
+            "sovits": self.config.get_sovits_model_path("_", lang).name,
+            "gpt": self.config.get_gpt_model_path("_", lang).name,
+            "ref_audio": self.config.get_ref_audio_path("_", lang).name,
+            "ref_text": self.config.get_ref_text_path("_", lang).name,
+            "preprocessed": self.config.get_preprocessed_audio_path("_", lang).name,
+        }
+
+        # scandir 한 번 + 캐릭터별 scandir 한 번으로 판정 (파일별 stat 생략)
         ready = []
-        for model_dir in lang_path.iterdir():
-            if model_dir.is_dir() and model_dir.name != "pretrained":
-                if self.is_trained(model_dir.name, lang):
-                    ready.append(model_dir.name)
+        with os.scandir(lang_path) as it:
+            for entry in it:
+                if entry.name == "pretrained" or not entry.is_dir(follow_symlinks=False):
+                    continue
+                if self._is_ready_dir(entry.path, names):
+                    ready.append(entry.name)
 
         return sorted(ready)
 
+    @staticmethod
+    def _is_ready_dir(model_dir: str, names: dict[str, str]) -> bool:
+        """캐릭터 모델 디렉토리 목록만으로 is_trained() 판정"""
+        try:
+            with os.scandir(model_dir) as it:
+                files = {entry.name for entry in it}
+        except OSError:
+            return False
+
+        # 새 구조: preprocessed 폴더 + info.json (wav/txt 쌍 존재)
+        if names["preprocessed"] in files and "info.json" in files:
+            has_wav = has_txt = False
+            try:
+                with os.scandir(os.path.join(model_dir, names["preprocessed"])) as it:
+                    for entry in it:
+                        if entry.name.endswith(".wav"):
+                            has_wav = True
+                        elif entry.name.endswith(".txt"):
+                            has_txt = True
+                        if has_wav and has_txt:
+                            return True
+            except OSError:
+                pass
+
+        # 레거시 구조: ref.wav + ref.txt
+        if names["ref_audio"] in files and names["ref_text"] in files:
+            return True
+
+        # 학습된 모델
+        return names["sovits"] in files and names["gpt"] in files
+
     def get_model_info(self, char_id: str, lang: str | None = None) -> ModelInfo | None:
         """모델 정보 조회"""
         lang = self._lang(lang)
-        config_path = self.config.get_config_path(char_id, lang)
-        if not config_path.exists():
+        paths = self._paths_for(char_id, lang)
+        config_path = paths["config"]
+        if not self._exists_cached(config_path):
             return None
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return None
+
+        has_sovits = self._exists_cached(paths["sovits"])
+        has_gpt = self._exists_cached(paths["gpt"])
+
+        key = (char_id, lang)
+        cached = self._info_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return replace(cached[1], has_sovits=has_sovits, has_gpt=has_gpt)
+
+        try:
+            data = _read_json(config_path)
             info = ModelInfo.from_dict(data)
-            info.has_sovits = self.config.get_sovits_model_path(char_id, lang).exists()
-            info.has_gpt = self.config.get_gpt_model_path(char_id, lang).exists()
-            return info
+            self._info_cache[key] = (mtime_ns, info)
+            return replace(info, has_sovits=has_sovits, has_gpt=has_gpt)
         except Exception as e:
             logger.error(f"모델 정보 로드 실패 ({char_id}): {e}")
             return None
@@ -122,53 +280,74 @@ class GPTSoVITSModelManager:
     def save_model_info(self, info: ModelInfo, lang: str | None = None):
         """모델 정보 저장"""
         lang = self._lang(lang)
-        model_dir = self.config.get_model_path(info.char_id, lang)
+        paths = self._paths_for(info.char_id, lang)
+        model_dir = paths["model"]
         model_dir.mkdir(parents=True, exist_ok=True)
 
-        config_path = self.config.get_config_path(info.char_id, lang)
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(info.to_dict(), f, ensure_ascii=False, indent=2)
+        config_path = paths["config"]
+        _write_json(config_path, info.to_dict())
+        self._invalidate_stat_cache()
+        self._invalidate_info_cache(info.char_id, lang)
 
     def list_all_models(self, lang: str | None = None) -> list[ModelInfo]:
         """모든 모델 정보 목록"""
+        return list(self.iter_all_models(lang))
+
+    def iter_all_models(self, lang: str | None = None) -> Iterator[ModelInfo]:
+        """모든 모델 정보를 하나씩 반환 (필요한 만큼만 조회)"""
         lang = self._lang(lang)
-        models = []
+        now_iso = datetime.now().isoformat()
         for char_id in self.get_trained_characters(lang):
             info = self.get_model_info(char_id, lang)
             if info:
-                models.append(info)
+                yield info
             else:
-                model_dir = self.config.get_model_path(char_id, lang)
-                ref_count = 0
-                preprocessed_dir = self.config.get_preprocessed_audio_path(char_id, lang)
-                if preprocessed_dir.exists():
-                    ref_count = len(list(preprocessed_dir.glob("*.wav")))
-                if ref_count == 0 and model_dir.exists():
-                    ref_count = len(list(model_dir.glob("ref*.wav")))
-
-                models.append(ModelInfo(
+                paths = self._paths_for(char_id, lang)
+                model_dir = paths["model"]
+                preprocessed_dir = paths["preprocessed"]
+                ref_count = self._count_files(preprocessed_dir, "", ".wav")
+                if ref_count == 0:
+                    ref_count = self._count_files(model_dir, "ref", ".wav")
+
+                yield ModelInfo(
                     char_id=char_id,
                     char_name=char_id,
-                    trained_at=datetime.now().isoformat(),
+                    trained_at=now_iso,
                     epochs_sovits=0,
                     epochs_gpt=0,
                     ref_audio_count=ref_count,
                     language=lang,
-                    has_sovits=self.config.get_sovits_model_path(char_id, lang).exists(),
-                    has_gpt=self.config.get_gpt_model_path(char_id, lang).exists(),
-                ))
-        return models
+                    has_sovits=self._exists_cached(paths["sovits"]),
+                    has_gpt=self._exists_cached(paths["gpt"]),
+                )
+
+    @staticmethod
+    def _count_files(directory: Path, prefix: str, suffix: str) -> int:
+        """prefix*suffix 형태 파일 개수 (scandir, 목록 생성 없이 집계)"""
+        try:
+            with os.scandir(directory) as it:
+                return sum(
+                    1 for entry in it
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(suffix)
+                    and entry.is_file(follow_symlinks=False)
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
 
     def delete_model(self, char_id: str, lang: str | None = None) -> bool:
         """모델 삭제"""
         lang = self._lang(lang)
-        model_dir = self.config.get_model_path(char_id, lang)
+        model_dir = self._paths_for(char_id, lang)["model"]
         if not model_dir.exists():
             return False
 
         try:
             import shutil
             shutil.rmtree(model_dir)
+            self._invalidate_stat_cache()
+            self._invalidate_info_cache(char_id, lang)
+            self._paths.pop((char_id, lang), None)
             logger.info(f"모델 삭제됨: {char_id} (lang={lang})")
             return True
         except Exception as e:
@@ -177,13 +356,13 @@ class GPTSoVITSModelManager:
 
     def get_sovits_path(self, char_id: str, lang: str | None = None) -> Path | None:
         """SoVITS 모델 경로 (존재하는 경우)"""
-        path = self.config.get_sovits_model_path(char_id, self._lang(lang))
-        return path if path.exists() else None
+        path = self._paths_for(char_id, self._lang(lang))["sovits"]
+        return path if self._exists_cached(path) else None
 
     def get_gpt_path(self, char_id: str, lang: str | None = None) -> Path | None:
         """GPT 모델 경로 (존재하는 경우)"""
-        path = self.config.get_gpt_model_path(char_id, self._lang(lang))
-        return path if path.exists() else None
+        path = self._paths_for(char_id, self._lang(lang))["gpt"]
+        return path if self._exists_cached(path) else None
 
     def create_model_info(
         self,
@@ -195,6 +374,10 @@ class GPTSoVITSModelManager:
         language: str = "ko",
     ) -> ModelInfo:
         """새 모델 정보 생성 및 저장"""
+        # 학습 직후 호출되므로 새로 생성된 모델 파일을 반영
+        self._invalidate_stat_cache()
+        self._invalidate_info_cache(char_id, language)
+        paths = self._paths_for(char_id, language)
         info = ModelInfo(
             char_id=char_id,
             char_name=char_name,
@@ -203,8 +386,8 @@ class GPTSoVITSModelManager:
             epochs_gpt=epochs_gpt,
             ref_audio_count=ref_audio_count,
             language=language,
-            has_sovits=self.config.get_sovits_model_path(char_id, language).exists(),
-            has_gpt=self.config.get_gpt_model_path(char_id, language).exists(),
+            has_sovits=self._exists_cached(paths["sovits"]),
+            has_gpt=self._exists_cached(paths["gpt"]),
         )
         self.save_model_info(info, language)
         return info
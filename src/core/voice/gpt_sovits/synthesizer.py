@@ -1,17 +1,31 @@
 """GPT-SoVITS 음성 합성기"""
 
 import asyncio
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import AsyncIterator
 
 from .config import GPTSoVITSConfig
 from .model_manager import GPTSoVITSModelManager
 from .api_client import GPTSoVITSAPIClient
+from ..common.audio_utils import parse_wav_duration
+from ..common.reference_manager import load_reference_info
 
 logger = logging.getLogger(__name__)
 
+# 합성 캐시 키 / 출력 파일명 해시 (보안 용도 아님): xxhash가 있으면 사용
+try:
+    from xxhash import xxh3_128_hexdigest as _fast_hash
+except ImportError:
+    def _fast_hash(data: bytes) -> str:
+        """bytes → 32자리 16진수 해시"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 @dataclass
 class SynthesisResult:
@@ -24,12 +38,27 @@ class SynthesisResult:
     sample_rate: int
 
 
+@dataclass(frozen=True, slots=True)
+class _ModelState:
+    """합성기 모델/API 상태 (필드 수정 없이 통째로 교체)"""
+
+    loaded_char: str | None = None
+    loaded_lang: str | None = None
+    api_started: bool = False
+
+    def is_loaded(self, char_id: str, lang: str | None) -> bool:
+        return self.loaded_char == char_id and self.loaded_lang == lang
+
+
 class GPTSoVITSSynthesizer:
     """GPT-SoVITS 음성 합성기
 
     GPT-SoVITS API 서버를 통해 텍스트를 음성으로 합성합니다.
     """
 
+    # 자동 경로 합성 결과 LRU 캐시 크기
+    RESULT_CACHE_SIZE = 256
+
     def __init__(
         self,
         config: GPTSoVITSConfig | None = None,
@@ -39,13 +68,17 @@ class GPTSoVITSSynthesizer:
         self.model_manager = model_manager or GPTSoVITSModelManager(self.config)
         self.api_client = GPTSoVITSAPIClient(self.config)
 
-        # 현재 로드된 모델 캐시
-        self._loaded_model_id: str | None = None
-        self._loaded_model_lang: str | None = None
-        self._model_loaded = False
-        self._api_started = False
-        self._synthesizing = False  # 합성 진행 중 플래그
+        # 현재 로드된 모델 / API 상태
+        self._state = _ModelState()
+        self._load_lock = asyncio.Lock()  # 동시 load_model 호출을 한 번의 로드로 합침
+        self._active_syntheses = 0  # 진행 중인 합성 수 (일괄 합성 시 동시 실행)
         self._force_zero_shot = False  # 제로샷 강제 모드 (테스트/비교용)
+        # 합성 키 -> 결과 (output_path 미지정 호출만 캐시)
+        self._result_cache: OrderedDict[str, SynthesisResult] = OrderedDict()
+        # 경로 -> (mtime_ns, 크기, 길이)
+        self._duration_cache: dict[str, tuple[int, int, float]] = {}
+        # info.json 경로 -> (mtime_ns, 참조 소스 경로 목록)
+        self._reference_sources_cache: dict[str, tuple[int, tuple[Path, ...]]] = {}
 
     async def ensure_api_running(self) -> bool:
         """API 서버가 실행 중인지 확인
@@ -58,7 +91,7 @@ class GPTSoVITSSynthesizer:
         """
         # 이미 실행 중인지 확인
         if await self.api_client.is_api_running():
-            self._api_started = True
+            self._state = replace(self._state, api_started=True)
             return True
 
         # 실행 중이 아니면 에러
@@ -77,7 +110,7 @@ class GPTSoVITSSynthesizer:
     @property
     def is_synthesizing(self) -> bool:
         """현재 음성 합성 진행 중 여부"""
-        return self._synthesizing
+        return self._active_syntheses > 0
 
     @property
     def force_zero_shot(self) -> bool:
@@ -93,9 +126,7 @@ class GPTSoVITSSynthesizer:
         if self._force_zero_shot != enabled:
             self._force_zero_shot = enabled
             # 모드 변경 시 현재 로드된 모델 해제 (다음 합성 시 재로드)
-            self._loaded_model_id = None
-            self._loaded_model_lang = None
-            self._model_loaded = False
+            self._state = replace(self._state, loaded_char=None, loaded_lang=None)
             logger.info(f"제로샷 강제 모드: {'활성화' if enabled else '비활성화'}")
 
     async def load_model(self, char_id: str, lang: str | None = None) -> bool:
@@ -104,9 +135,18 @@ class GPTSoVITSSynthesizer:
         이미 로드된 모델이면 스킵합니다.
         Zero-shot 모드에서는 사전 학습된 모델을 사용합니다.
         """
-        if self._loaded_model_id == char_id and self._loaded_model_lang == lang and self._model_loaded:
+        if self._state.is_loaded(char_id, lang):
             return True
 
+        # API 서버는 한 번에 한 모델만 보유하므로 로드를 직렬화
+        async with self._load_lock:
+            # 대기하는 동안 다른 호출이 같은 모델을 로드했으면 재사용
+            if self._state.is_loaded(char_id, lang):
+                return True
+            return await self._load_model(char_id, lang)
+
+    async def _load_model(self, char_id: str, lang: str | None) -> bool:
+        """모델 로드 (_load_lock 안에서 호출)"""
         if not await self.is_available(char_id, lang):
             logger.error(f"모델이 존재하지 않음: {char_id} (lang={lang})")
             return False
@@ -127,9 +167,7 @@ class GPTSoVITSSynthesizer:
                 # Zero-shot: 사전 학습된 모델 사용 (모델 로드 불필요)
                 mode_reason = "강제 제로샷" if (has_trained and self._force_zero_shot) else "사전 학습 모델"
                 logger.info(f"Zero-shot 모드: {char_id} ({mode_reason} 사용, lang={lang})")
-                self._loaded_model_id = char_id
-                self._loaded_model_lang = lang
-                self._model_loaded = True
+                self._state = replace(self._state, loaded_char=char_id, loaded_lang=lang)
                 return True
             else:
                 # 학습된 모델 로드
@@ -142,9 +180,7 @@ class GPTSoVITSSynthesizer:
 
                 logger.info(f"학습된 모델 로드 중: {char_id} (lang={lang})")
                 if await self.api_client.set_model(char_id, lang):
-                    self._loaded_model_id = char_id
-                    self._loaded_model_lang = lang
-                    self._model_loaded = True
+                    self._state = replace(self._state, loaded_char=char_id, loaded_lang=lang)
                     logger.info(f"모델 로드 완료: {char_id} (lang={lang})")
                     return True
                 else:
@@ -153,18 +189,14 @@ class GPTSoVITSSynthesizer:
 
         except Exception as e:
             logger.error(f"모델 로드 실패 ({char_id}): {e}")
-            self._loaded_model_id = None
-            self._loaded_model_lang = None
-            self._model_loaded = False
+            self._state = replace(self._state, loaded_char=None, loaded_lang=None)
             return False
 
     async def unload_model(self):
         """현재 모델 언로드"""
-        if self._model_loaded:
-            logger.info(f"모델 언로드: {self._loaded_model_id}")
-            self._loaded_model_id = None
-            self._loaded_model_lang = None
-            self._model_loaded = False
+        if self._state.loaded_char is not None:
+            logger.info(f"모델 언로드: {self._state.loaded_char}")
+            self._state = replace(self._state, loaded_char=None, loaded_lang=None)
 
     async def synthesize(
         self,
@@ -177,6 +209,7 @@ class GPTSoVITSSynthesizer:
         top_p: float = 1.0,
         temperature: float = 0.8,  # 낮은 온도로 안정성 향상
         nickname: str | None = None,
+        make_parent_dir: bool = True,
     ) -> SynthesisResult | None:
         """텍스트를 음성으로 합성
 
@@ -189,55 +222,77 @@ class GPTSoVITSSynthesizer:
             top_k: 샘플링 다양성 (1~20)
             top_p: Nucleus sampling (0.1~1.0)
             temperature: 음성 랜덤성 (0.1~2.0)
+            make_parent_dir: output_path 상위 디렉토리 생성 여부 (일괄 합성은 미리 생성)
 
         Returns:
             SynthesisResult 또는 실패 시 None
         """
         # 모델 로드 확인 (캐릭터 또는 언어가 다르면 재로드)
-        if self._loaded_model_id != char_id or self._loaded_model_lang != language:
+        if not self._state.is_loaded(char_id, language):
             if not await self.load_model(char_id, language):
                 return None
+        state = self._state
 
-        # 출력 경로 설정
+        # 출력 경로 설정 (자동 경로는 동일 요청이면 이전 결과 재사용)
+        cache_key = None
         if output_path is None:
-            import hashlib
+            cache_key = _fast_hash("\x00".join((
+                char_id, language, text, str(nickname),
+                f"{speed_factor}:{top_k}:{top_p}:{temperature}:{int(self._force_zero_shot)}",
+            )).encode("utf-8"))
+            cached = self._get_cached_result(cache_key, char_id, language)
+            if cached is not None:
+                logger.info(f"[Synthesizer] 캐시된 결과 사용: {cached.audio_path.name}")
+                return cached
 
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
             output_path = (
-                self.config.get_model_path(char_id, language) / "outputs" / f"{text_hash}.wav"
+                self.config.get_model_path(char_id, language) / "outputs" / f"{cache_key}.wav"
             )
+            if self._is_output_fresh(output_path, char_id, language):
+                result = SynthesisResult(
+                    char_id=char_id,
+                    text=text,
+                    audio_path=output_path,
+                    duration=self._get_audio_duration(output_path),
+                    sample_rate=self.config.sample_rate,
+                )
+                self._put_cached_result(cache_key, result)
+                logger.info(f"[Synthesizer] 기존 합성 파일 사용: {output_path.name}")
+                return result
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            make_parent_dir = False
 
         try:
             logger.info(f"[Synthesizer] 합성 시작: {char_id}")
             logger.info(f"[Synthesizer] 텍스트: {text[:50]}{'...' if len(text) > 50 else ''}")
 
             # API 서버 확인 (시작 전에만 체크, 합성 중에는 블로킹되므로 스킵)
-            if not self._api_started:
+            if not state.api_started:
                 logger.error("GPT-SoVITS API 서버가 시작되지 않았습니다")
                 return None
 
-            # 합성 상태 플래그 설정
-            self._synthesizing = True
-
-            # 음성 합성
-            success = await self.api_client.synthesize_to_file(
-                text=text,
-                char_id=char_id,
-                output_path=output_path,
-                language=language,
-                speed_factor=speed_factor,
-                top_k=top_k,
-                top_p=top_p,
-                temperature=temperature,
-                nickname=nickname,
-            )
-
-            self._synthesizing = False
+            # 합성 상태 카운트
+            self._active_syntheses += 1
+            try:
+                duration = await self.api_client.synthesize_to_file(
+                    text=text,
+                    char_id=char_id,
+                    output_path=output_path,
+                    language=language,
+                    speed_factor=speed_factor,
+                    top_k=top_k,
+                    top_p=top_p,
+                    temperature=temperature,
+                    nickname=nickname,
+                    make_parent_dir=make_parent_dir,
+                )
+            finally:
+                self._active_syntheses -= 1
 
-            if success:
-                # 오디오 파일에서 실제 길이 계산
-                duration = self._get_audio_duration(output_path)
+            if duration is not None:
+                # 길이는 저장 시 헤더에서 계산됨 (해석 실패 시에만 파일 재확인)
+                if duration <= 0:
+                    duration = self._get_audio_duration(output_path)
                 result = SynthesisResult(
                     char_id=char_id,
                     text=text,
@@ -245,6 +300,8 @@ class GPTSoVITSSynthesizer:
                     duration=duration,
                     sample_rate=self.config.sample_rate,
                 )
+                if cache_key is not None:
+                    self._put_cached_result(cache_key, result)
                 logger.info(f"[Synthesizer] 합성 완료: {duration:.2f}초")
                 return result
             else:
@@ -252,7 +309,6 @@ class GPTSoVITSSynthesizer:
                 return None
 
         except Exception as e:
-            self._synthesizing = False
             logger.error(f"음성 합성 실패: {e}")
             return None
 
@@ -263,7 +319,7 @@ class GPTSoVITSSynthesizer:
         output_dir: Path,
         language: str = "ko",
     ) -> AsyncIterator[tuple[int, SynthesisResult | None]]:
-        """여러 텍스트를 순차적으로 합성
+        """여러 텍스트를 동시에 합성 (config.batch_concurrency개까지)
 
         Args:
             char_id: 캐릭터 ID
@@ -272,7 +328,7 @@ class GPTSoVITSSynthesizer:
             language: 언어 코드
 
         Yields:
-            (인덱스, SynthesisResult) 튜플
+            (인덱스, SynthesisResult) 튜플 (입력 순서)
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -280,61 +336,174 @@ class GPTSoVITSSynthesizer:
         if not await self.load_model(char_id, language):
             return
 
-        for i, text in enumerate(texts):
-            output_path = output_dir / f"{i:04d}.wav"
-            result = await self.synthesize(
-                char_id, text, output_path=output_path, language=language
-            )
-            yield i, result
+        sem = asyncio.Semaphore(max(1, self.config.batch_concurrency))
+        # 출력 경로 템플릿 (디렉토리는 위에서 한 번만 생성)
+        path_fmt = str(output_dir / "{:04d}.wav")
+
+        async def one(i: int, text: str) -> tuple[int, SynthesisResult | None]:
+            async with sem:
+                return i, await self.synthesize(
+                    char_id,
+                    text,
+                    output_path=Path(path_fmt.format(i)),
+                    language=language,
+                    make_parent_dir=False,
+                )
+
+        tasks = [asyncio.create_task(one(i, text)) for i, text in enumerate(texts)]
+        # 먼저 끝난 결과는 보관했다가 입력 순서대로 내보냄
+        pending: dict[int, SynthesisResult | None] = {}
+        next_to_yield = 0
+        try:
+            for coro in asyncio.as_completed(tasks):
+                i, result = await coro
+                pending[i] = result
+                while next_to_yield in pending:
+                    yield next_to_yield, pending.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            # 소비자가 중간에 중단하면 남은 합성 취소
+            for task in tasks:
+                task.cancel()
+
+    def _get_cached_result(
+        self, key: str, char_id: str, language: str
+    ) -> SynthesisResult | None:
+        """캐시된 합성 결과 (파일이 유효한 경우만)"""
+        result = self._result_cache.get(key)
+        if result is None:
+            return None
+        if not self._is_output_fresh(result.audio_path, char_id, language):
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _put_cached_result(self, key: str, result: SynthesisResult) -> None:
+        """합성 결과 캐시에 추가 (LRU)"""
+        self._result_cache[key] = result
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _is_output_fresh(self, path: Path, char_id: str, language: str) -> bool:
+        """합성 파일이 존재하고 현재 모델/참조 파일보다 최신인지 확인"""
+        try:
+            output_mtime = path.stat().st_mtime_ns
+        except OSError:
+            return False
+        # 재학습된 모델이나 다시 준비된 참조(제로샷 포함)보다 오래된 결과는 사용하지 않음
+        for source in (
+            self.model_manager.get_sovits_path(char_id, language),
+            self.model_manager.get_gpt_path(char_id, language),
+            *self._reference_sources(char_id, language),
+        ):
+            if source is None:
+                continue
+            try:
+                if source.stat().st_mtime_ns > output_mtime:
+                    return False
+            except OSError:
+                continue
+        return True
+
+    def _reference_sources(self, char_id: str, language: str) -> tuple[Path, ...]:
+        """합성 결과에 영향을 주는 참조 파일 목록
+
+        info.json(참조 텍스트 포함)과 거기 나열된 참조 오디오, 레거시 ref.wav/ref.txt,
+        info.json에 목록이 없을 때 쓰이는 preprocessed 폴더를 반환합니다.
+        """
+        model_dir = self.config.get_model_path(char_id, language)
+        info_path = model_dir / "info.json"
+        sources = (
+            info_path,
+            model_dir / "ref.wav",
+            model_dir / "ref.txt",
+            model_dir / "preprocessed",
+        )
+        try:
+            info_mtime = info_path.stat().st_mtime_ns
+        except OSError:
+            return sources
+
+        key = str(info_path)
+        cached = self._reference_sources_cache.get(key)
+        if cached is not None and cached[0] == info_mtime:
+            return cached[1]
+
+        info = load_reference_info(model_dir) or {}
+        sources += tuple(
+            model_dir / ref["audio"]
+            for ref in info.get("ref_audios", ())
+            if ref.get("audio")
+        )
+        self._reference_sources_cache[key] = (info_mtime, sources)
+        return sources
 
     def get_reference_audio(self, char_id: str, lang: str | None = None) -> Path | None:
         """참조 오디오 경로 조회"""
-        ref_dir = self.config.get_model_path(char_id, lang or self._loaded_model_lang) / "ref_audio"
-        if not ref_dir.exists():
-            return None
+        ref_dir = self.config.get_model_path(char_id, lang or self._state.loaded_lang) / "ref_audio"
 
         # 첫 번째 참조 오디오 반환
-        for audio_file in ref_dir.iterdir():
-            if audio_file.suffix.lower() in (".wav", ".mp3"):
-                return audio_file
+        try:
+            with os.scandir(ref_dir) as it:
+                for entry in it:
+                    if os.path.splitext(entry.name)[1][1:].lower() in ("wav", "mp3"):
+                        return Path(entry.path)
+        except OSError:
+            return None
 
         return None
 
     def _get_audio_duration(self, path: Path) -> float:
-        """오디오 파일 길이 계산 (초)"""
-        try:
-            import wave
+        """오디오 파일 길이 계산 (초)
 
-            with wave.open(str(path), "rb") as wav_file:
-                frames = wav_file.getnframes()
-                rate = wav_file.getframerate()
-                return frames / float(rate)
-        except Exception as e:
+        WAV 헤더(앞부분 128바이트)만 읽어 계산하고, 헤더 해석이 안 되면
+        wave 모듈로 처리합니다. (경로, mtime, 크기)가 같으면 재사용합니다.
+        """
+        try:
+            st = os.stat(path)
+            key = str(path)
+            cached = self._duration_cache.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+
+            with open(path, "rb") as f:
+                hdr = f.read(128)
+        except OSError as e:
             logger.warning(f"오디오 길이 계산 실패: {e}")
             return 0.0
 
+        duration = parse_wav_duration(hdr, st.st_size)
+        if duration is None:
+            try:
+                import wave
+
+                with wave.open(str(path), "rb") as wav_file:
+                    frames = wav_file.getnframes()
+                    rate = wav_file.getframerate()
+                    duration = frames / float(rate)
+            except Exception as e:
+                logger.warning(f"오디오 길이 계산 실패: {e}")
+                return 0.0
+
+        if len(self._duration_cache) >= self.RESULT_CACHE_SIZE * 4:
+            self._duration_cache.clear()
+        self._duration_cache[key] = (st.st_mtime_ns, st.st_size, duration)
+        return duration
+
     async def shutdown(self):
         """리소스 정리"""
         await self.api_client.close()
-        self._api_started = False
-        self._loaded_model_id = None
-        self._loaded_model_lang = None
-        self._model_loaded = False
-
-
-# 싱글톤 인스턴스
-_synthesizer: GPTSoVITSSynthesizer | None = None
+        self._state = _ModelState()
 
 
+@functools.cache
 def get_synthesizer() -> GPTSoVITSSynthesizer:
-    """합성기 싱글톤 인스턴스 반환"""
-    global _synthesizer
-    if _synthesizer is None:
-        _synthesizer = GPTSoVITSSynthesizer()
-    return _synthesizer
+    """합성기 싱글톤 인스턴스 반환 (새 인스턴스가 필요하면 reset_synthesizer 호출)"""
+    return GPTSoVITSSynthesizer()
 
 
 def reset_synthesizer() -> None:
     """합성기 싱글톤 리셋 (언어 변경 시)"""
-    global _synthesizer
-    _synthesizer = None
+    get_synthesizer.cache_clear()
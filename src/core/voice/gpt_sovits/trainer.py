@@ -6,19 +6,60 @@ GPT-SoVITS를 사용한 캐릭터 음성 클로닝.
 """
 
 import asyncio
-import json
 import logging
-import subprocess
+import os
+import re
 import sys
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
 from .config import GPTSoVITSConfig
 from .model_manager import GPTSoVITSModelManager
+from ...common.language_codes import SHORT_TO_VOICE_FOLDER
+
+# 워커 진행 메시지(JSON 라인) 파싱: orjson이 있으면 사용
+try:
+    from orjson import loads as _json_loads, JSONDecodeError as _JSONDecodeError
+except ImportError:
+    from json import loads as _json_loads, JSONDecodeError as _JSONDecodeError
 
 logger = logging.getLogger(__name__)
 
+# 워커 stdout 한 번에 읽을 최대 바이트 (가능한 만큼 모아 읽고 라인 단위로 분리)
+_READ_CHUNK_SIZE = 64 * 1024
+
+# 워커 일반 출력 분류 (에러/트레이스백 → warning 우선, 에포크/손실 → info, 나머지 → debug)
+_ERROR_LINE = re.compile(rb"error|traceback|exception", re.IGNORECASE)
+_INFO_LINE = re.compile(rb"epoch|loss|step", re.IGNORECASE)
+
+
+_AUDIO_EXTENSIONS = ("mp3", "wav")
+
+
+def _count_audio_files(audio_dir: Path) -> int:
+    """오디오 파일(mp3/wav) 개수 (scandir 한 번)"""
+    try:
+        with os.scandir(audio_dir) as it:
+            return sum(
+                1 for entry in it
+                if os.path.splitext(entry.name)[1][1:].lower() in _AUDIO_EXTENSIONS
+                and entry.is_file()
+            )
+    except OSError:
+        return 0
+
+
+# 워커 progress 메시지에서 누락된 필드 기본값 (TrainingProgress 필드 순서)
+_PROGRESS_DEFAULTS = {
+    "stage": "",
+    "progress": 0,
+    "current_epoch": 0,
+    "total_epochs": 0,
+    "message": "",
+}
+
 
 @dataclass
 class TrainingProgress:
@@ -40,6 +81,18 @@ class GPTSoVITSTrainer:
     subprocess로 worker 스크립트를 실행하여 비동기 처리.
     """
 
+    # mode별 워커 스크립트 (절대 경로 문자열, 모듈 로드 시 한 번 계산)
+    _WORKER_SCRIPTS = {
+        "finetune": str((Path(__file__).parent / "finetuning_worker.py").absolute()),
+        "prepare": str((Path(__file__).parent / "training_worker.py").absolute()),
+    }
+    # 존재 확인을 마친 워커 스크립트
+    _verified_scripts: set[str] = set()
+    # stdout EOF 이후 워커 종료 대기 한도 (초)
+    EXIT_WAIT_TIMEOUT = 30.0
+    # 실패 메시지에 포함할 최근 에러 출력 줄 수
+    ERROR_LINES_KEPT = 10
+
     def __init__(
         self,
         config: Optional[GPTSoVITSConfig] = None,
@@ -48,9 +101,14 @@ class GPTSoVITSTrainer:
         self.config = config or GPTSoVITSConfig()
         self.model_manager = model_manager or GPTSoVITSModelManager(self.config)
         self._cancelled = False
-        self._process: Optional[subprocess.Popen] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._kill_task: Optional[asyncio.Task] = None
+        self._drain_task: Optional[asyncio.Task] = None
         self._last_error: str = ""
-        self._last_error_lines: list[str] = []
+        # 에러로 보이는 최근 워커 출력 (실패 시 마지막 줄들만 사용)
+        self._last_error_lines: deque[str] = deque(maxlen=self.ERROR_LINES_KEPT)
+        # (설정 키, 공통 워커 인자)
+        self._base_cmd_cache: Optional[tuple[tuple, tuple[str, ...]]] = None
 
     @property
     def last_error(self) -> str:
@@ -60,12 +118,63 @@ class GPTSoVITSTrainer:
     def cancel(self):
         """학습 취소"""
         self._cancelled = True
-        if self._process and self._process.poll() is None:
-            self._process.terminate()
+        if self._process and self._process.returncode is None:
+            self._terminate(self._process)
+
+    def _terminate(self, process: asyncio.subprocess.Process):
+        """워커 종료 요청 (5초 내 종료되지 않으면 kill)"""
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            return
+        self._kill_task = asyncio.get_running_loop().create_task(
+            self._kill_after(process, 5.0)
+        )
+
+    @staticmethod
+    async def _drain(process: asyncio.subprocess.Process):
+        """남은 stdout을 버리며 프로세스 종료 대기 (파이프가 가득 차 멈추지 않도록)"""
+        if process.stdout:
+            while await process.stdout.read(_READ_CHUNK_SIZE):
+                pass
+        await process.wait()
+
+    @staticmethod
+    async def _kill_after(process: asyncio.subprocess.Process, grace: float):
+        """grace초 후에도 살아 있으면 강제 종료"""
+        try:
+            await asyncio.wait_for(process.wait(), timeout=grace)
+        except asyncio.TimeoutError:
             try:
-                self._process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    def _base_cmd(self, worker_script: str, gamedata_path: Path, finetune: bool) -> tuple[str, ...]:
+        """작업과 무관한 워커 명령 인자 (설정이 바뀌지 않으면 이전 결과 재사용)"""
+        config = self.config
+        key = (
+            worker_script, gamedata_path, config.gpt_sovits_path, config.epochs_sovits,
+            config.epochs_gpt, config.default_language, finetune and config.cleanup_after_training,
+        )
+        if self._base_cmd_cache is not None and self._base_cmd_cache[0] == key:
+            return self._base_cmd_cache[1]
+
+        base = [
+            sys.executable,
+            worker_script,
+            "--gamedata-path", str(gamedata_path.absolute()),
+            "--gpt-sovits-path", str(config.gpt_sovits_path),
+            "--epochs-sovits", str(config.epochs_sovits),
+            "--epochs-gpt", str(config.epochs_gpt),
+            "--language", config.default_language,
+        ]
+        # finetune 모드: cleanup 옵션 전달
+        if finetune:
+            base.append("--cleanup" if config.cleanup_after_training else "--no-cleanup")
+
+        self._base_cmd_cache = (key, tuple(base))
+        return self._base_cmd_cache[1]
 
     async def train(
         self,
@@ -89,10 +198,9 @@ class GPTSoVITSTrainer:
         """
         self._cancelled = False
         self._last_error = ""
-        self._last_error_lines = []
+        self._last_error_lines.clear()
 
         # 디버그: CWD 로깅
-        import os
         logger.info(f"[Debug] CWD: {os.getcwd()}")
         logger.info(f"[Debug] audio_files: {len(audio_files) if audio_files else 0}개")
 
@@ -101,16 +209,15 @@ class GPTSoVITSTrainer:
             audio_dir = audio_files[0].parent.absolute()
             logger.info(f"[Debug] audio_dir from files: {audio_dir}")
         else:
-            # 언어별 폴더 매핑
-            from ...common.language_codes import SHORT_TO_VOICE_FOLDER
+            # 언어별 폴더 매핑 (extracted_path는 설정 생성 시 절대 경로로 변환됨)
             lang_folder = SHORT_TO_VOICE_FOLDER.get(self.config.default_language, "voice")
-            audio_dir = (self.config.extracted_path / lang_folder / char_id).absolute()
+            audio_dir = self.config.extracted_path / lang_folder / char_id
             logger.info(f"[Debug] audio_dir from config: {audio_dir}")
 
             # 폴백: 언어별 폴더가 없으면 기본 voice 폴더 시도
             if not audio_dir.exists():
                 logger.warning(f"언어별 폴더 없음: {audio_dir}, 기본 폴더 시도")
-                audio_dir = (self.config.extracted_path / "voice" / char_id).absolute()
+                audio_dir = self.config.extracted_path / "voice" / char_id
 
         if not audio_dir.exists():
             logger.error(f"오디오 디렉토리가 없습니다: {audio_dir}")
@@ -120,52 +227,40 @@ class GPTSoVITSTrainer:
         output_dir = self.config.get_model_path(char_id)  # default_language 사용
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # mode에 따라 워커 스크립트 선택
-        if mode == "finetune":
-            worker_script = Path(__file__).parent / "finetuning_worker.py"
-        else:
-            worker_script = Path(__file__).parent / "training_worker.py"
+        # mode에 따라 워커 스크립트 선택 (최초 사용 시 한 번만 존재 확인)
+        worker_script = self._WORKER_SCRIPTS["finetune" if mode == "finetune" else "prepare"]
+        if worker_script not in self._verified_scripts:
+            if not Path(worker_script).is_file():
+                logger.error(f"워커 스크립트가 없습니다: {worker_script}")
+                self._last_error = f"워커 스크립트가 없습니다: {worker_script}"
+                return False
+            self._verified_scripts.add(worker_script)
 
         # gamedata 경로 (charword_table.json 위치)
         from ...backend.config import config as server_config
         gamedata_path = server_config.gamedata_path
 
-        # 모든 경로를 절대 경로로 변환 (subprocess CWD와 무관하게 동작하도록)
+        # 모든 경로를 절대 경로로 전달 (subprocess CWD와 무관하게 동작하도록)
+        # audio_dir / output_dir는 이미 절대 경로
         cmd = [
-            sys.executable,
-            str(worker_script.absolute()),
+            *self._base_cmd(worker_script, gamedata_path, finetune=mode == "finetune"),
             "--char-id", char_id,
             "--char-name", char_name,
-            "--audio-dir", str(audio_dir.absolute()),
-            "--output-dir", str(output_dir.absolute()),
-            "--gamedata-path", str(gamedata_path.absolute()),
-            "--gpt-sovits-path", str(self.config.gpt_sovits_path.absolute()),
-            "--epochs-sovits", str(self.config.epochs_sovits),
-            "--epochs-gpt", str(self.config.epochs_gpt),
-            "--language", self.config.default_language,
+            "--audio-dir", str(audio_dir),
+            "--output-dir", str(output_dir),
         ]
 
-        # finetune 모드: cleanup 옵션 전달
-        if mode == "finetune":
-            if self.config.cleanup_after_training:
-                cmd.append("--cleanup")
-            else:
-                cmd.append("--no-cleanup")
-
         mode_label = "학습" if mode == "finetune" else "준비"
         logger.info(f"{mode_label} 시작: {char_id} ({char_name}) [mode={mode}]")
         logger.debug(f"명령: {' '.join(cmd)}")
 
         try:
             logger.info(f"워커 실행: {' '.join(cmd[:3])}...")  # 명령어 일부만 로깅
-            self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # stderr를 stdout으로 리다이렉트
-                text=True,
-                encoding="utf-8",
-                errors="replace",  # 디코딩 실패 시 대체 문자 사용
-                bufsize=1,  # 라인 버퍼링
+            self._process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,  # stderr를 stdout으로 리다이렉트
+                limit=1 << 20,
             )
 
             # stdout에서 진행 상황 읽기 (stderr 포함)
@@ -187,7 +282,7 @@ class GPTSoVITSTrainer:
                     char_name=char_name,
                     epochs_sovits=epochs_sovits,
                     epochs_gpt=epochs_gpt,
-                    ref_audio_count=len(list(audio_dir.glob("*.mp3"))) + len(list(audio_dir.glob("*.wav"))),
+                    ref_audio_count=_count_audio_files(audio_dir),
                     language=self.config.default_language,
                 )
                 logger.info(f"음성 {mode_label} 완료: {char_id} ({char_name})")
@@ -200,9 +295,91 @@ class GPTSoVITSTrainer:
             logger.error(f"학습 중 오류 ({char_id}): {e}")
             return False
 
+        except asyncio.CancelledError:
+            # 작업 태스크가 취소된 경우에도 워커가 남지 않도록 종료
+            if self._process and self._process.returncode is None:
+                self._terminate(self._process)
+            raise
+
         finally:
+            if self._process and self._process.returncode is None and not self._cancelled:
+                # 완료/에러 메시지 이후 워커가 정리 중일 수 있음: 출력을 비우며 종료 대기
+                self._drain_task = asyncio.get_running_loop().create_task(
+                    self._drain(self._process)
+                )
             self._process = None
 
+    def _handle_output_line(
+        self,
+        raw: bytes,
+        on_progress: Optional[Callable[[TrainingProgress], None]] = None,
+    ) -> Optional[bool]:
+        """워커 출력 한 줄 처리
+
+        Returns:
+            완료/에러 메시지면 성공 여부, 계속 읽어야 하면 None
+        """
+        raw = raw.strip()
+        if not raw:
+            return None
+
+        # 워커 메시지는 JSON 객체 한 줄: 라이브러리 로그 등 나머지는 파싱 시도 생략
+        data = None
+        if raw[:1] == b"{":
+            try:
+                data = _json_loads(raw)
+            except _JSONDecodeError:
+                pass
+
+        if not isinstance(data, dict):
+            # 에러/트레이스백 감지
+            if _ERROR_LINE.search(raw):
+                line = raw.decode("utf-8", errors="replace")  # 디코딩 실패 시 대체 문자 사용
+                logger.warning(f"워커 출력: {line}")
+                self._last_error_lines.append(line)
+            # 에포크, 손실 등 중요 정보는 info 레벨로 출력
+            elif _INFO_LINE.search(raw):
+                logger.info("워커 출력: %s", raw.decode("utf-8", errors="replace"))
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug("워커 출력: %s", raw.decode("utf-8", errors="replace"))
+            return None
+
+        msg_type = data.get("type")
+
+        if msg_type == "progress":
+            if on_progress:
+                # 기본값 위에 메시지를 덮어써 한 번에 채움 (추가 키는 무시)
+                fields = {**_PROGRESS_DEFAULTS, **data}
+                on_progress(
+                    TrainingProgress(
+                        fields["stage"],
+                        fields["progress"],
+                        fields["current_epoch"],
+                        fields["total_epochs"],
+                        fields["message"],
+                    )
+                )
+
+        elif msg_type == "error":
+            error_msg = data.get('message', '학습 실패')
+            error_detail = data.get('error', '')
+            self._last_error = f"{error_msg}: {error_detail}" if error_detail else error_msg
+            logger.error(f"워커 에러: {self._last_error}")
+            return False
+
+        elif msg_type == "complete":
+            if on_progress:
+                on_progress(
+                    TrainingProgress(
+                        stage="complete",
+                        progress=1.0,
+                        message=f"{data.get('char_name')} 학습 완료!",
+                    )
+                )
+            return True
+
+        return None
+
     async def _read_progress(
         self,
         on_progress: Optional[Callable[[TrainingProgress], None]] = None,
@@ -211,76 +388,47 @@ class GPTSoVITSTrainer:
         if not self._process or not self._process.stdout:
             return False
 
-        loop = asyncio.get_event_loop()
+        stdout = self._process.stdout
+        pending = b""
 
         while True:
             if self._cancelled:
                 return False
 
-            # 비동기로 stdout 읽기
-            line = await loop.run_in_executor(None, self._process.stdout.readline)
+            # 비동기로 stdout 읽기 (도착한 만큼 한 번에 읽어 여러 줄 처리)
+            chunk = await stdout.read(_READ_CHUNK_SIZE)
 
-            if not line:
-                # 프로세스 종료
-                break
+            if not chunk:
+                # 프로세스 종료 (마지막 줄에 개행이 없을 수 있음)
+                lines = [pending] if pending else []
+                pending = b""
+            else:
+                *lines, pending = (pending + chunk).split(b"\n")
 
-            line = line.strip()
-            if not line:
-                continue
+            for raw in lines:
+                result = self._handle_output_line(raw, on_progress)
+                if result is not None:
+                    return result
 
-            try:
-                data = json.loads(line)
-                msg_type = data.get("type")
-
-                if msg_type == "progress":
-                    if on_progress:
-                        on_progress(
-                            TrainingProgress(
-                                stage=data.get("stage", ""),
-                                progress=data.get("progress", 0),
-                                current_epoch=data.get("current_epoch", 0),
-                                total_epochs=data.get("total_epochs", 0),
-                                message=data.get("message", ""),
-                            )
-                        )
-
-                elif msg_type == "error":
-                    error_msg = data.get('message', '학습 실패')
-                    error_detail = data.get('error', '')
-                    self._last_error = f"{error_msg}: {error_detail}" if error_detail else error_msg
-                    logger.error(f"워커 에러: {self._last_error}")
-                    return False
-
-                elif msg_type == "complete":
-                    if on_progress:
-                        on_progress(
-                            TrainingProgress(
-                                stage="complete",
-                                progress=1.0,
-                                message=f"{data.get('char_name')} 학습 완료!",
-                            )
-                        )
-                    return True
-
-            except json.JSONDecodeError:
-                # 에러/트레이스백 감지
-                if "error" in line.lower() or "traceback" in line.lower() or "exception" in line.lower():
-                    logger.warning(f"워커 출력: {line}")
-                    self._last_error_lines.append(line)
-                    if len(self._last_error_lines) > 20:
-                        self._last_error_lines.pop(0)
-                # 에포크, 손실 등 중요 정보는 info 레벨로 출력
-                elif "epoch" in line.lower() or "loss" in line.lower() or "step" in line.lower():
-                    logger.info(f"워커 출력: {line}")
-                else:
-                    logger.debug(f"워커 출력: {line}")
+            if not chunk:
+                break
 
-        # 프로세스 종료 코드 확인
-        return_code = self._process.wait()
+        # 프로세스 종료 코드 확인 (stdout을 닫고도 끝나지 않으면 강제 종료)
+        try:
+            return_code = await asyncio.wait_for(
+                self._process.wait(), timeout=self.EXIT_WAIT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"워커가 {self.EXIT_WAIT_TIMEOUT:.0f}초 내 종료되지 않아 강제 종료합니다")
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+            return_code = await self._process.wait()
         if return_code != 0:
             logger.error(f"워커 프로세스 종료 코드: {return_code}")
             if self._last_error_lines:
-                error_text = "\n".join(self._last_error_lines[-10:])
+                error_text = "\n".join(self._last_error_lines)
                 logger.error(f"마지막 에러:\n{error_text}")
                 # CUDA OOM 감지
                 if any(p in error_text.lower() for p in [
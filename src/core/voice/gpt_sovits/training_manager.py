@@ -2,6 +2,10 @@
 
 import asyncio
 import logging
+import os
+import shutil
+import stat
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,9 +16,14 @@ from typing import Callable
 from .config import GPTSoVITSConfig
 from .model_manager import GPTSoVITSModelManager
 from .trainer import GPTSoVITSTrainer, TrainingProgress
+from ...common.language_codes import SHORT_TO_VOICE_FOLDER
+from ..common.audio_utils import list_audio_files
 
 logger = logging.getLogger(__name__)
 
+# 학습용 오디오 확장자
+_AUDIO_EXTENSIONS = ("mp3", "wav", "ogg")
+
 
 class TrainingStatus(str, Enum):
     """학습 상태"""
@@ -44,9 +53,33 @@ class TrainingJob:
     created_at: datetime = field(default_factory=datetime.now)
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    # (시각 튜플, ISO 문자열 튜플): 상태 폴링마다 isoformat 반복 방지
+    _iso_cache: tuple[tuple, tuple] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # to_dict 결과 (필드가 바뀌면 __setattr__에서 무효화)
+    _dict_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name not in ("_dict_cache", "_iso_cache"):
+            object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, name, value)
+
+    def _timestamps_iso(self) -> tuple:
+        """created/started/completed 시각의 ISO 문자열 (시각이 바뀔 때만 다시 포맷)"""
+        stamps = (self.created_at, self.started_at, self.completed_at)
+        cached = self._iso_cache
+        if cached is None or any(a is not b for a, b in zip(cached[0], stamps)):
+            cached = (stamps, tuple(t.isoformat() if t else None for t in stamps))
+            self._iso_cache = cached
+        return cached[1]
 
     def to_dict(self) -> dict:
-        return {
+        """직렬화용 딕셔너리 (변경 없으면 같은 객체 재사용, 수정하지 말 것)"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        created_at, started_at, completed_at = self._timestamps_iso()
+        self._dict_cache = {
             "job_id": self.job_id,
             "char_id": self.char_id,
             "char_name": self.char_name,
@@ -57,10 +90,11 @@ class TrainingJob:
             "total_epochs": self.total_epochs,
             "message": self.message,
             "error_message": self.error_message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": created_at,
+            "started_at": started_at,
+            "completed_at": completed_at,
         }
+        return self._dict_cache
 
 
 class TrainingManager:
@@ -72,6 +106,11 @@ class TrainingManager:
     - 진행 상황 콜백 지원
     """
 
+    # 학습 진행 알림 최소 간격 (초): 단계/에포크 변경·완료는 즉시, 나머지는 마지막 값만 모아서 알림
+    PROGRESS_NOTIFY_INTERVAL = 0.1
+    # 보관할 최대 작업 수 (초과 시 끝난 작업부터 오래된 순으로 제거)
+    MAX_JOBS_KEPT = 1024
+
     def __init__(
         self,
         config: GPTSoVITSConfig | None = None,
@@ -83,27 +122,56 @@ class TrainingManager:
 
         self._queue: asyncio.Queue[TrainingJob] = asyncio.Queue()
         self._jobs: dict[str, TrainingJob] = {}
+        # 상태별 작업 색인 (상태 조회 시 전체 작업 순회 방지, _set_status로만 변경)
+        self._jobs_by_status: dict[TrainingStatus, dict[str, TrainingJob]] = {
+            status: {} for status in TrainingStatus
+        }
         self._current_job: TrainingJob | None = None
         self._is_running = False
         self._worker_task: asyncio.Task | None = None
-        self._progress_callbacks: list[Callable[[TrainingJob], None]] = []
+        # 학습 중 미리 꺼낸 다음 작업과 오디오 파일 목록 탐색 태스크
+        self._prefetched: tuple[TrainingJob, asyncio.Task[list[Path]]] | None = None
+        # 알림 중 등록/제거되어도 안전하도록 튜플로 교체하며 관리
+        self._progress_callbacks: tuple[Callable[[TrainingJob], None], ...] = ()
+        # 알림 대기 중인 작업 (같은 작업은 최신 상태 한 번만 전달)
+        self._dirty_jobs: dict[str, TrainingJob] = {}
+        self._dispatch_scheduled = False
+        # 오디오 디렉토리 -> (mtime_ns, 파일 목록) (일괄 학습 시 재탐색 방지)
+        self._audio_files_cache: dict[str, tuple[int, list[Path]]] = {}
 
     def add_progress_callback(self, callback: Callable[[TrainingJob], None]):
         """진행 상황 콜백 등록"""
-        self._progress_callbacks.append(callback)
+        self._progress_callbacks += (callback,)
 
     def remove_progress_callback(self, callback: Callable[[TrainingJob], None]):
         """진행 상황 콜백 제거"""
         if callback in self._progress_callbacks:
-            self._progress_callbacks.remove(callback)
+            callbacks = list(self._progress_callbacks)
+            callbacks.remove(callback)
+            self._progress_callbacks = tuple(callbacks)
 
     def _notify_progress(self, job: TrainingJob):
-        """진행 상황 알림"""
-        for callback in self._progress_callbacks:
-            try:
-                callback(job)
-            except Exception as e:
-                logger.error(f"Progress callback error: {e}")
+        """진행 상황 알림 예약 (학습 출력 처리 중에는 콜백을 호출하지 않음)
+
+        콜백(SSE 큐 등)은 이벤트 루프 스레드에서만 안전하므로 스레드 대신
+        call_soon으로 다음 루프 차례에 모아서 호출합니다.
+        """
+        self._dirty_jobs[job.job_id] = job
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            asyncio.get_running_loop().call_soon(self._dispatch_progress)
+
+    def _dispatch_progress(self):
+        """예약된 작업별 최신 상태를 콜백에 전달"""
+        jobs = list(self._dirty_jobs.values())
+        self._dirty_jobs.clear()
+        self._dispatch_scheduled = False
+        for job in jobs:
+            for callback in self._progress_callbacks:
+                try:
+                    callback(job)
+                except Exception as e:
+                    logger.error(f"Progress callback error: {e}")
 
     async def start(self):
         """작업 워커 시작"""
@@ -134,21 +202,38 @@ class TrainingManager:
         """작업 처리 워커"""
         while self._is_running:
             try:
-                # 큐에서 작업 가져오기 (타임아웃 1초)
-                try:
-                    job = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
+                # 학습 중 미리 꺼내 둔 작업이 있으면 먼저 처리
+                if self._prefetched is not None:
+                    job, files_task = self._prefetched
+                    self._prefetched = None
+                else:
+                    # 큐에서 작업 가져오기 (stop()이 워커 태스크를 취소하면 대기도 함께 종료)
+                    job = await self._queue.get()
+                    files_task = None
+
+                # 대기 중 취소된 작업은 건너뛰기 (큐에는 남아 있음)
+                if job.status != TrainingStatus.PENDING:
                     continue
 
                 self._current_job = job
-                job.status = TrainingStatus.PREPROCESSING
+                self._set_status(job, TrainingStatus.PREPROCESSING)
                 job.started_at = datetime.now()
                 self._notify_progress(job)
 
-                # 오디오 파일 가져오기
-                audio_files = self._get_audio_files(job.char_id)
+                # 오디오 파일 가져오기 (디렉토리 탐색은 스레드에서, 미리 시작했으면 결과만 대기)
+                if files_task is None:
+                    audio_files = await asyncio.to_thread(self._get_audio_files, job.char_id)
+                else:
+                    try:
+                        audio_files = await asyncio.shield(files_task)
+                    except asyncio.CancelledError:
+                        # 워커 중지: 큐에서 이미 꺼낸 작업이므로 다음 시작 시 처리되도록 되돌려 둠
+                        self._set_status(job, TrainingStatus.PENDING)
+                        self._current_job = None
+                        self._prefetched = (job, files_task)
+                        raise
                 if not audio_files:
-                    job.status = TrainingStatus.FAILED
+                    self._set_status(job, TrainingStatus.FAILED)
                     job.error_message = "오디오 파일을 찾을 수 없습니다"
                     job.completed_at = datetime.now()
                     self._notify_progress(job)
@@ -156,38 +241,73 @@ class TrainingManager:
                     continue
 
                 # 학습 실행
-                job.status = TrainingStatus.TRAINING
+                self._set_status(job, TrainingStatus.TRAINING)
+
+                loop = asyncio.get_running_loop()
+                interval = self.PROGRESS_NOTIFY_INTERVAL
+                last_notify = 0.0
+                last_stage: str | None = None
+                pending_flush: asyncio.TimerHandle | None = None
+
+                def flush_progress():
+                    nonlocal last_notify, pending_flush
+                    pending_flush = None
+                    last_notify = time.monotonic()
+                    self._notify_progress(job)
 
                 def on_progress(progress: TrainingProgress):
+                    nonlocal last_stage, pending_flush
+                    epoch_changed = progress.current_epoch != job.current_epoch
                     job.progress = progress.progress
                     job.current_epoch = progress.current_epoch
                     job.total_epochs = progress.total_epochs
                     job.message = progress.message
-                    self._notify_progress(job)
 
-                success = await self.trainer.train(
-                    char_id=job.char_id,
-                    char_name=job.char_name,
-                    audio_files=audio_files,
-                    mode=job.mode,
-                    on_progress=on_progress,
-                )
+                    elapsed = time.monotonic() - last_notify
+                    if (
+                        progress.stage != last_stage
+                        or epoch_changed
+                        or progress.progress >= 1.0
+                        or elapsed >= interval
+                    ):
+                        last_stage = progress.stage
+                        if pending_flush is not None:
+                            pending_flush.cancel()
+                        flush_progress()
+                    elif pending_flush is None:
+                        # 간격 안에 더 이상 갱신이 없어도 마지막 값이 전달되도록 예약
+                        pending_flush = loop.call_later(interval - elapsed, flush_progress)
+
+                # GPU가 학습하는 동안 다음 작업의 준비를 미리 진행
+                self._prefetch_next_job()
+
+                try:
+                    success = await self.trainer.train(
+                        char_id=job.char_id,
+                        char_name=job.char_name,
+                        audio_files=audio_files,
+                        mode=job.mode,
+                        on_progress=on_progress,
+                    )
+                finally:
+                    if pending_flush is not None:
+                        pending_flush.cancel()
 
                 if success:
-                    job.status = TrainingStatus.COMPLETED
+                    self._set_status(job, TrainingStatus.COMPLETED)
                     job.progress = 1.0
                     job.message = "학습 완료"
                 else:
                     if self.trainer._cancelled:
-                        job.status = TrainingStatus.CANCELLED
+                        self._set_status(job, TrainingStatus.CANCELLED)
                         job.message = "학습 취소됨"
                     else:
-                        job.status = TrainingStatus.FAILED
+                        self._set_status(job, TrainingStatus.FAILED)
                         job.error_message = self.trainer.last_error or "학습 실패"
 
                     # prepare 모드에서 취소/실패 시 부분 생성 파일 정리
                     if job.mode == "prepare":
-                        self._cleanup_partial_prepare(job.char_id)
+                        await self._cleanup_partial_prepare(job.char_id)
 
                 job.completed_at = datetime.now()
                 self._notify_progress(job)
@@ -196,16 +316,31 @@ class TrainingManager:
             except Exception as e:
                 logger.error(f"Worker error: {e}")
                 if self._current_job:
-                    self._current_job.status = TrainingStatus.FAILED
+                    self._set_status(self._current_job, TrainingStatus.FAILED)
                     self._current_job.error_message = str(e)
                     self._current_job.completed_at = datetime.now()
                     self._notify_progress(self._current_job)
                     self._current_job = None
 
-    def _cleanup_partial_prepare(self, char_id: str):
-        """prepare 취소/실패 시 부분 생성 파일 정리"""
-        import shutil
+    def _set_status(self, job: TrainingJob, status: TrainingStatus):
+        """작업 상태 변경 (상태별 색인 함께 갱신)"""
+        self._jobs_by_status[job.status].pop(job.job_id, None)
+        job.status = status
+        self._jobs_by_status[status][job.job_id] = job
+
+    def _prefetch_next_job(self):
+        """다음 대기 작업을 미리 꺼내 오디오 파일 목록 탐색 시작 (이전 학습이 끝나면 바로 시작)"""
+        while self._prefetched is None and not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job.status != TrainingStatus.PENDING:
+                continue
+            files_task = asyncio.create_task(
+                asyncio.to_thread(self._get_audio_files, job.char_id)
+            )
+            self._prefetched = (job, files_task)
 
+    async def _cleanup_partial_prepare(self, char_id: str):
+        """prepare 취소/실패 시 부분 생성 파일 정리 (삭제는 스레드에서 실행)"""
         # info.json이 없으면 불완전한 준비 → preprocessed 폴더 삭제
         lang = self.config.default_language
         info_path = self.config.get_model_path(char_id, lang) / "info.json"
@@ -213,34 +348,51 @@ class TrainingManager:
             return  # 완료된 준비는 건드리지 않음
 
         preprocessed_dir = self.config.get_preprocessed_audio_path(char_id, lang)
-        if preprocessed_dir.exists():
-            try:
-                shutil.rmtree(preprocessed_dir)
-                logger.info(f"부분 준비 파일 정리: {char_id}")
-            except Exception as e:
-                logger.error(f"부분 준비 파일 정리 실패 ({char_id}): {e}")
+        try:
+            # 큰 폴더 삭제 동안 이벤트 루프가 멈추지 않도록 (없으면 FileNotFoundError)
+            await asyncio.to_thread(shutil.rmtree, preprocessed_dir)
+            logger.info(f"부분 준비 파일 정리: {char_id}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"부분 준비 파일 정리 실패 ({char_id}): {e}")
 
     def _get_audio_files(self, char_id: str) -> list[Path]:
         """캐릭터 오디오 파일 목록 (extracted/{lang_folder}/{char_id}/ 구조)"""
         # 언어별 폴더 매핑
-        from ...common.language_codes import SHORT_TO_VOICE_FOLDER
         lang_folder = SHORT_TO_VOICE_FOLDER.get(self.config.default_language, "voice")
-        # 절대 경로 사용 (CWD 무관하게 동작)
-        audio_dir = (self.config.extracted_path / lang_folder / char_id).absolute()
+        # 절대 경로 사용 (extracted_path는 설정 생성 시 절대 경로로 변환됨)
+        audio_dir = self.config.extracted_path / lang_folder / char_id
 
+        # stat 한 번으로 존재 확인 + mtime 획득
         # 폴백: 언어별 폴더가 없으면 기본 voice 폴더 시도
-        if not audio_dir.exists():
-            audio_dir = (self.config.extracted_path / "voice" / char_id).absolute()
-            if not audio_dir.exists():
+        st = self._stat_dir(audio_dir)
+        if st is None:
+            audio_dir = self.config.extracted_path / "voice" / char_id
+            st = self._stat_dir(audio_dir)
+            if st is None:
                 logger.warning(f"오디오 디렉토리 없음: {audio_dir}")
                 return []
 
-        files = []
-        for ext in ["*.mp3", "*.wav", "*.ogg"]:
-            files.extend(audio_dir.glob(ext))
-
-        # 절대 경로로 반환
-        return sorted([f.absolute() for f in files])
+        # 디렉토리 mtime이 같으면 (파일 추가/삭제 없음) 이전 탐색 결과 재사용
+        key = str(audio_dir)
+        cached = self._audio_files_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return list(cached[1])
+
+        # scandir 한 번으로 확장자 판별 (audio_dir이 절대 경로이므로 결과도 절대 경로)
+        files = list_audio_files(audio_dir, _AUDIO_EXTENSIONS)
+        self._audio_files_cache[key] = (st.st_mtime_ns, files)
+        return list(files)
+
+    @staticmethod
+    def _stat_dir(path: Path) -> os.stat_result | None:
+        """디렉토리 stat (없거나 디렉토리가 아니면 None)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st if stat.S_ISDIR(st.st_mode) else None
 
     async def queue_training(
         self, char_id: str, char_name: str, mode: str = "prepare"
@@ -270,12 +422,27 @@ class TrainingManager:
         )
 
         self._jobs[job.job_id] = job
+        self._jobs_by_status[job.status][job.job_id] = job
+        self._prune_jobs()
         await self._queue.put(job)
 
         mode_label = "학습" if mode == "finetune" else "준비"
         logger.info(f"{mode_label} 큐 추가: {char_id} ({char_name}) [mode={mode}]")
         return job
 
+    def _prune_jobs(self):
+        """MAX_JOBS_KEPT 초과 시 끝난 작업을 오래된 순으로 제거 (대기/진행 중 작업은 유지)"""
+        excess = len(self._jobs) - self.MAX_JOBS_KEPT
+        if excess <= 0:
+            return
+        finished = (TrainingStatus.COMPLETED, TrainingStatus.FAILED, TrainingStatus.CANCELLED)
+        stale = [
+            job_id for job_id, job in self._jobs.items() if job.status in finished
+        ][:excess]
+        for job_id in stale:
+            job = self._jobs.pop(job_id)
+            self._jobs_by_status[job.status].pop(job_id, None)
+
     async def queue_batch_training(
         self, characters: list[tuple[str, str]], mode: str = "prepare"
     ) -> list[TrainingJob]:
@@ -290,9 +457,11 @@ class TrainingManager:
         """
         jobs = []
         lang = self.config.default_language
+        # 준비 완료 캐릭터는 모델 디렉토리를 한 번 훑어 미리 구함 (캐릭터별 판정 생략)
+        ready_ids = set(self.model_manager.get_trained_characters(lang)) if mode == "prepare" else set()
         for char_id, char_name in characters:
             # 이미 완료된 캐릭터는 건너뛰기
-            if mode == "prepare" and self.model_manager.is_trained(char_id, lang):
+            if mode == "prepare" and char_id in ready_ids:
                 logger.info(f"이미 준비됨, 건너뛰기: {char_id}")
                 continue
             if mode == "finetune" and self.model_manager.has_trained_model(char_id, lang):
@@ -314,7 +483,7 @@ class TrainingManager:
 
     def get_pending_jobs(self) -> list[TrainingJob]:
         """대기 중인 작업 목록"""
-        return [j for j in self._jobs.values() if j.status == TrainingStatus.PENDING]
+        return list(self._jobs_by_status[TrainingStatus.PENDING].values())
 
     def get_current_job(self) -> TrainingJob | None:
         """현재 진행 중인 작업"""
@@ -327,9 +496,10 @@ class TrainingManager:
             return False
 
         if job.status == TrainingStatus.PENDING:
-            # 대기 중인 작업은 상태만 변경
-            job.status = TrainingStatus.CANCELLED
+            # 대기 중인 작업은 상태만 변경 (큐에서 꺼낼 때 건너뜀)
+            self._set_status(job, TrainingStatus.CANCELLED)
             job.completed_at = datetime.now()
+            logger.info(f"대기 작업 취소: {job.char_id} ({job.job_id})")
             self._notify_progress(job)
             return True
 
@@ -343,7 +513,7 @@ class TrainingManager:
     def get_status_summary(self) -> dict:
         """전체 상태 요약"""
         total_trained = len(self.model_manager.get_trained_characters(self.config.default_language))
-        pending_count = len(self.get_pending_jobs())
+        pending_count = len(self._jobs_by_status[TrainingStatus.PENDING])
 
         return {
             "is_training": self._current_job is not None,
@@ -14,6 +14,7 @@ import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -36,7 +37,17 @@ from core.voice.common.reference_manager import (
     is_excluded_voice,
     select_best_references,
 )
-from core.voice.common.audio_utils import get_audio_duration
+from core.voice.common.audio_utils import get_audio_duration, list_audio_files
+
+
+def _emit(data: dict):
+    """메시지 한 줄을 UTF-8 바이트로 stdout에 기록 (트레이너가 줄 단위 바이트로 파싱)
+
+    콘솔 코드 페이지와 무관하게 UTF-8로 쓰고, 쓰기/flush를 한 번씩만 수행합니다.
+    """
+    sys.stdout.flush()  # print 등으로 텍스트 계층에 남은 출력을 먼저 내보냄
+    sys.stdout.buffer.write(json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def emit_progress(stage: str, progress: float, message: str, **kwargs):
@@ -48,7 +59,7 @@ def emit_progress(stage: str, progress: float, message: str, **kwargs):
         "message": message,
         **kwargs,
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def emit_error(message: str, error: str = ""):
@@ -58,7 +69,7 @@ def emit_error(message: str, error: str = ""):
         "message": message,
         "error": error,
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def emit_complete(char_id: str, char_name: str, model_path: str):
@@ -69,7 +80,7 @@ def emit_complete(char_id: str, char_name: str, model_path: str):
         "char_name": char_name,
         "model_path": model_path,
     }
-    print(json.dumps(data, ensure_ascii=False), flush=True)
+    _emit(data)
 
 
 def load_charword_transcripts(
@@ -90,8 +101,33 @@ def load_charword_transcripts(
     return _load(char_id, gamedata_path, language)
 
 
+def _convert_to_wav_in_process(input_path: Path, output_path: Path) -> bool:
+    """soundfile + soxr로 32kHz 모노 WAV 변환 (ffmpeg 프로세스 실행 생략)"""
+    try:
+        import soundfile as sf
+        import soxr
+    except ImportError:
+        return False
+
+    try:
+        data, sr = sf.read(str(input_path), dtype="float32", always_2d=False)
+        if data.ndim == 2:
+            data = data.mean(axis=1)
+        if sr != 32000:
+            data = soxr.resample(data, sr, 32000, quality="HQ")
+        sf.write(str(output_path), data, 32000, subtype="PCM_16")
+        return True
+    except Exception as e:
+        # libsndfile이 읽지 못하는 형식 등: ffmpeg로 재시도
+        logger.debug(f"in-process 변환 실패, ffmpeg 사용: {input_path.name} ({e})")
+        return False
+
+
 def convert_to_wav(input_path: Path, output_path: Path) -> bool:
     """오디오 파일을 WAV로 변환 (32kHz 모노)"""
+    if _convert_to_wav_in_process(input_path, output_path):
+        return True
+
     try:
         result = subprocess.run(
             [
@@ -277,7 +313,7 @@ def prepare_reference_audio(
     emit_progress("preprocessing", 0.1, "오디오 파일 수집 중...")
 
     # 오디오 파일 목록
-    audio_files = list(audio_dir.glob("*.mp3")) + list(audio_dir.glob("*.wav"))
+    audio_files = list_audio_files(audio_dir)
     if not audio_files:
         emit_error("오디오 파일이 없습니다", str(audio_dir))
         return False
@@ -376,6 +412,8 @@ def prepare_reference_audio(
         # 폴백: 원본 오디오 파일 사용
         emit_progress("preprocessing", 0.5, "원본 오디오 파일 사용 (Whisper 미사용)")
 
+        # 텍스트/제외 조건을 먼저 걸러 길이 측정 대상을 줄임
+        texted_files = []
         for audio_file in audio_files:
             voice_id = audio_file.stem  # CN_001
             transcript_info = transcripts.get(voice_id, {})
@@ -389,8 +427,13 @@ def prepare_reference_audio(
             if is_excluded_voice(title, text):
                 continue
 
-            duration = get_audio_duration(audio_file)
+            texted_files.append((audio_file, text, title))
+
+        # 파일별 길이 측정은 I/O 대기 위주이므로 스레드로 동시에 진행
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            durations = list(executor.map(get_audio_duration, [f for f, _, _ in texted_files]))
 
+        for (audio_file, text, title), duration in zip(texted_files, durations):
             # 공통 함수로 점수 계산
             score, is_valid_duration = calculate_reference_score(
                 title, text, duration, min_duration, max_duration